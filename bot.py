@@ -3,12 +3,15 @@ import discord
 from discord.ext import commands
 import asyncio
 import sys
+import os
 from datetime import datetime, timedelta
 import json
+import hashlib
+from collections import OrderedDict
 
 # Import our custom modules
 from config import *
-from queries import LibraryDatabase, get_library_stats, search_library, get_dropdown_options
+from queries import get_database, search_library_page_async, count_library_cached, get_library_stats_cached, get_dropdown_options_cached, invalidate_caches
 
 # Bot setup
 intents = discord.Intents.default()
@@ -18,31 +21,58 @@ bot = commands.Bot(command_prefix=COMMAND_PREFIX, description=BOT_DESCRIPTION, i
 # Global admin operation lock
 admin_operation_lock = asyncio.Lock()
 
-def get_database():
-    """Get a new database connection for each operation"""
-    return LibraryDatabase()
+# Set by on_ready and after admin updates, so commands don't re-validate the database each time
+_DB_READY = False
 
 @bot.event
 async def on_ready():
     """Called when bot is ready"""
+    global _DB_READY
     print(f'🤖 {bot.user} has connected to Discord!')
     print(f'📊 Bot is in {len(bot.guilds)} guilds')
     
-    # Validate database
+    # Validate database (off the event loop - SQLite calls block)
     db = get_database()
-    if db.validate_database():
-        stats = get_library_stats()
+    _DB_READY = await asyncio.to_thread(db.validate_database)
+    if _DB_READY:
+        stats = await asyncio.to_thread(get_library_stats_cached)
         print(f'📚 Database connected: {stats["total_articles"]} articles available')
     else:
-        print('⚠️  Warning: Database not found or empty. Run the scraper first!')
+        print('⚠️  Warning: Database not found, empty, or not migrated. Run the scraper first!')
     
     # Sync slash commands
     try:
-        synced = await bot.tree.sync()
-        print(f'🔄 Synced {len(synced)} slash commands')
+        await sync_commands()
     except Exception as e:
         print(f'❌ Failed to sync commands: {e}')
 
+def command_signature_hash(guild_id):
+    """Hash the registered command names, descriptions and parameters"""
+    signature = [
+        (command.qualified_name, command.description,
+         [(param.name, param.description, param.required) for param in getattr(command, 'parameters', [])])
+        for command in bot.tree.get_commands()
+    ]
+    return hashlib.sha256(json.dumps([guild_id, signature]).encode()).hexdigest()
+
+async def sync_commands():
+    """Sync slash commands to GUILD_ID (or globally), skipping the call when nothing changed"""
+    guild = discord.Object(id=GUILD_ID) if GUILD_ID else None
+    if guild:
+        bot.tree.copy_global_to(guild=guild)
+    
+    signature = command_signature_hash(GUILD_ID)
+    if os.path.exists(COMMAND_SYNC_FILE):
+        with open(COMMAND_SYNC_FILE) as f:
+            if f.read().strip() == signature:
+                print('🔄 Slash commands unchanged, skipping sync')
+                return
+    
+    synced = await bot.tree.sync(guild=guild)
+    print(f'🔄 Synced {len(synced)} slash commands' + (f' to guild {GUILD_ID}' if guild else ''))
+    with open(COMMAND_SYNC_FILE, 'w') as f:
+        f.write(signature)
+
 # Utility Functions
 def create_embed(title, description=None, color=COLORS["primary"]):
     """Create a standard embed"""
@@ -52,16 +82,17 @@ def create_embed(title, description=None, color=COLORS["primary"]):
 
 def format_article(article, show_description=True):
     """Format an article with category/author on one line, tags on separate line"""
-    title = article['title'][:100] + "..." if len(article['title']) > 100 else article['title']
+    title = article['title']
+    if len(title) > 100:
+        title = title[:97] + "..."
     
     # Get essential info
-    categories = article['categories'] if article['categories'] != 'Uncategorized' else 'General'
-    category = categories.split(',')[0]  # Just first category
-    author = article['author'] if article['author'] != 'Unknown' else 'Unknown'
+    categories = article['categories']
+    category = 'General' if categories == 'Uncategorized' else categories.split(',', 1)[0]  # Just first category
+    author = article['author'] or 'Unknown'
     
-    # ALL tags
-    tags = article['tags'] if article['tags'] else []
-    tags_text = ', '.join(tags) if tags else 'No tags'
+    # ALL tags, pre-joined at scrape time
+    tags_text = article['tags_display'] or 'No tags'
     
     # Clean format: category/author on one line, tags on next, no description
     return (f"**[{title}]({article['url']})**\n"
@@ -70,11 +101,54 @@ def format_article(article, show_description=True):
 
 def has_admin_role(member):
     """Check if member has admin permissions"""
-    if member.guild_permissions.administrator:
-        return True
+    # Short-circuits on the first matching role; no intermediate list of names
+    return (member.guild_permissions.administrator
+            or any(role.name in ADMIN_ROLE_NAMES for role in member.roles))
+
+async def communicate_with_progress(process, interaction, timeout, title):
+    """Wait for a scraper subprocess, editing the status embed while it runs"""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    communicate = asyncio.ensure_future(process.communicate())
     
-    member_roles = [role.name for role in member.roles]
-    return any(role in ADMIN_ROLE_NAMES for role in member_roles)
+    while True:
+        remaining = timeout - (loop.time() - started)
+        if remaining <= 0:
+            process.kill()
+            await communicate  # Drains the pipes and reaps the killed process
+            raise TimeoutError(f"Scraper ran longer than {timeout} seconds")
+        
+        done, _ = await asyncio.wait({communicate}, timeout=min(SCRAPER_PROGRESS_INTERVAL, remaining))
+        if done:
+            return communicate.result()
+        
+        elapsed_minutes = (loop.time() - started) / 60
+        embed = create_embed(title, f"Still running... {elapsed_minutes:.1f} minutes elapsed.", COLORS["info"])
+        try:
+            await interaction.edit_original_response(embed=embed)
+        except discord.HTTPException:
+            pass  # Progress edits are best-effort
+
+# Dropdown SelectOptions shared by every LibraryView (never mutated after building)
+_PREBUILT_OPTIONS = {"source": None, "categories": [], "authors": [], "tags": []}
+
+def _build_select_options(all_label, values):
+    """Build a dropdown's options with a leading "All ..." entry to clear the filter"""
+    if not values:
+        return []
+    options = [discord.SelectOption(label=all_label, value="clear")]
+    options.extend(discord.SelectOption(label=value[:100], value=value) for value in values[:24])  # Leave room for "All"
+    return options
+
+def get_prebuilt_options():
+    """Get SelectOption lists for the dropdowns, rebuilt only when the cached options change"""
+    options = get_dropdown_options_cached()
+    if _PREBUILT_OPTIONS["source"] is not options:
+        _PREBUILT_OPTIONS["categories"] = _build_select_options("All Categories", options['categories'])
+        _PREBUILT_OPTIONS["authors"] = _build_select_options("All Authors", options['authors'])
+        _PREBUILT_OPTIONS["tags"] = _build_select_options("All Tags", options['tags'])
+        _PREBUILT_OPTIONS["source"] = options
+    return _PREBUILT_OPTIONS
 
 # Description Modal for individual articles
 class DescriptionModal(discord.ui.Modal):
@@ -88,9 +162,10 @@ class DescriptionModal(discord.ui.Modal):
 
 # Library View Class with Auto-Delete on Timeout
 class LibraryView(discord.ui.View):
-    def __init__(self, user_id):
+    def __init__(self, user_id, interaction, options):
         super().__init__(timeout=600)  # 10 minutes
         self.user_id = user_id
+        self._interaction = interaction  # Used to clean up the message on timeout
         self.created_at = datetime.now()
         
         # Each user gets their own independent state
@@ -100,22 +175,47 @@ class LibraryView(discord.ui.View):
             'tag': None,
             'search_term': None
         }
-        self.current_results = []
+        self.current_page_rows = []  # Only the rows on the current page are held
+        self.current_formatted = []  # format_article output for current_page_rows
         self.current_page = 0
-        
-        # Add dropdowns
-        self.add_category_dropdown()
-        self.add_author_dropdown()
-        self.add_tag_dropdown()
+        self.total_results = 0
+        self.total_pages = 0  # Derived from total_results once per search
+        self.page_cursor = None  # Keyset cursor where the current page starts
+        self.next_cursor = None  # Where the next page starts (None on the last page)
+        self.prev_cursor_stack = []  # Start cursors of the pages before this one
+        # LRU of loaded pages keyed by (filters, cursor), so flipping back or re-picking a filter skips the query
+        self._page_cache = OrderedDict()
+        self._results_embed = None  # Last results embed, reused while the page it shows is unchanged
+        self._results_embed_key = None
+        
+        # Add dropdowns (prebuilt SelectOption lists, fetched by the caller off the event loop)
+        # Each add_*_dropdown keeps a direct reference; None when there are no options
+        self.cat_select = None
+        self.author_select = None
+        self.tag_select = None
+        self._options = options
+        self.add_category_dropdown(self._options['categories'])
+        self.add_author_dropdown(self._options['authors'])
+        self.add_tag_dropdown(self._options['tags'])
+        self._update_nav_buttons()
+    
+    def _update_nav_buttons(self):
+        """Enable Previous/Next only when there is a page to move to"""
+        self.previous_button.disabled = self.current_page == 0
+        self.next_button.disabled = self.next_cursor is None or self.current_page >= self.total_pages - 1
+    
+    async def _acknowledge(self, interaction):
+        """Defer an interaction that updates the library message, keeping it for on_timeout"""
+        await interaction.response.defer()
+        # Only interactions that own the library message are kept (not modals or ephemeral
+        # replies), and the newest one's token is the least likely to have expired
+        self._interaction = interaction
     
     async def on_timeout(self):
         """Auto-delete the message when timed out"""
-        if not hasattr(self, '_message') or not self._message:
-            return  # No message to clean up
-        
         try:
-            # Try to delete the message directly
-            await self._message.delete()
+            # Delete through the interaction webhook - works for ephemeral messages too
+            await self._interaction.delete_original_response()
         except discord.NotFound:
             # Message already deleted
             pass
@@ -129,159 +229,155 @@ class LibraryView(discord.ui.View):
                     f"📚 **Use `/library` to open a fresh interface!**",
                     COLORS["secondary"]
                 )
-                await self._message.edit(embed=timeout_embed, view=None)
+                await self._interaction.edit_original_response(embed=timeout_embed, view=None)
             except:
                 pass
         except Exception as e:
             print(f"Error during timeout cleanup: {e}")
     
-    def add_category_dropdown(self):
+    def add_category_dropdown(self, options):
         """Add category dropdown"""
         try:
-            options = get_dropdown_options()['categories']
-            
             if options:
-                dropdown_options = [discord.SelectOption(label="All Categories", value="clear")]
-                dropdown_options.extend([
-                    discord.SelectOption(label=cat[:100], value=cat) for cat in options[:24]  # Leave room for "All"
-                ])
-                
                 category_dropdown = discord.ui.Select(
                     placeholder="Choose a category...",
-                    options=dropdown_options,
+                    options=options,
                     custom_id="category_select"
                 )
                 category_dropdown.callback = self.category_callback
                 self.add_item(category_dropdown)
+                self.cat_select = category_dropdown
         except Exception as e:
             print(f"Error adding category dropdown: {e}")
     
-    def add_author_dropdown(self):
+    def add_author_dropdown(self, options):
         """Add author dropdown"""
         try:
-            options = get_dropdown_options()['authors']
-            
             if options:
-                dropdown_options = [discord.SelectOption(label="All Authors", value="clear")]
-                dropdown_options.extend([
-                    discord.SelectOption(label=author[:100], value=author) for author in options[:24]
-                ])
-                
                 author_dropdown = discord.ui.Select(
                     placeholder="Choose an author...",
-                    options=dropdown_options,
+                    options=options,
                     custom_id="author_select"
                 )
                 author_dropdown.callback = self.author_callback
                 self.add_item(author_dropdown)
+                self.author_select = author_dropdown
         except Exception as e:
             print(f"Error adding author dropdown: {e}")
     
-    def add_tag_dropdown(self):
+    def add_tag_dropdown(self, options):
         """Add tag dropdown"""
         try:
-            options = get_dropdown_options()['tags']
-            
             if options:
-                dropdown_options = [discord.SelectOption(label="All Tags", value="clear")]
-                dropdown_options.extend([
-                    discord.SelectOption(label=tag[:100], value=tag) for tag in options[:24]
-                ])
-                
                 tag_dropdown = discord.ui.Select(
                     placeholder="Choose a tag...",
-                    options=dropdown_options,
+                    options=options,
                     custom_id="tag_select"
                 )
                 tag_dropdown.callback = self.tag_callback
                 self.add_item(tag_dropdown)
+                self.tag_select = tag_dropdown
         except Exception as e:
             print(f"Error adding tag dropdown: {e}")
     
-    async def category_callback(self, interaction):
-        """Handle category selection"""
+    async def _apply_filter(self, interaction, filter_key, select, label, default_placeholder):
+        """Apply a dropdown selection to the filters and refresh the results"""
+        # Acknowledge within Discord's 3 s window before any database work
+        await self._acknowledge(interaction)
+        
         selected = interaction.data['values'][0]
-        self.current_filters['category'] = None if selected == "clear" else selected
+        self.current_filters[filter_key] = None if selected == "clear" else selected
         
         # Update dropdown placeholder to show selected value
-        for item in self.children:
-            if isinstance(item, discord.ui.Select) and item.custom_id == "category_select":
-                if selected == "clear":
-                    item.placeholder = "Choose a category..."
-                else:
-                    item.placeholder = f"Category: {selected[:80]}{'...' if len(selected) > 80 else ''}"
-                break
+        if selected == "clear":
+            select.placeholder = default_placeholder
+        else:
+            select.placeholder = f"{label}: {selected[:80]}{'...' if len(selected) > 80 else ''}"
         
         await self.update_results(interaction)
     
+    async def category_callback(self, interaction):
+        """Handle category selection"""
+        await self._apply_filter(interaction, 'category', self.cat_select, "Category", "Choose a category...")
+    
     async def author_callback(self, interaction):
         """Handle author selection"""
-        selected = interaction.data['values'][0]
-        self.current_filters['author'] = None if selected == "clear" else selected
-        
-        # Update dropdown placeholder to show selected value
-        for item in self.children:
-            if isinstance(item, discord.ui.Select) and item.custom_id == "author_select":
-                if selected == "clear":
-                    item.placeholder = "Choose an author..."
-                else:
-                    item.placeholder = f"Author: {selected[:80]}{'...' if len(selected) > 80 else ''}"
-                break
-        
-        await self.update_results(interaction)
+        await self._apply_filter(interaction, 'author', self.author_select, "Author", "Choose an author...")
     
     async def tag_callback(self, interaction):
         """Handle tag selection"""
-        selected = interaction.data['values'][0]
-        self.current_filters['tag'] = None if selected == "clear" else selected
-        
-        # Update dropdown placeholder to show selected value
-        for item in self.children:
-            if isinstance(item, discord.ui.Select) and item.custom_id == "tag_select":
-                if selected == "clear":
-                    item.placeholder = "Choose a tag..."
-                else:
-                    item.placeholder = f"Tag: {selected[:80]}{'...' if len(selected) > 80 else ''}"
-                break
-        
-        await self.update_results(interaction)
+        await self._apply_filter(interaction, 'tag', self.tag_select, "Tag", "Choose a tag...")
     
     async def update_results(self, interaction):
-        """Update and display search results"""
-        await interaction.response.defer()
-        
+        """Update and display search results (the interaction must already be deferred)"""
         try:
-            # Search with current filters using fresh database connection
-            self.current_results = search_library(
+            # Count (capped at SEARCH_RESULTS_LIMIT, cached per filter set) on a worker thread
+            self.total_results = await asyncio.to_thread(
+                count_library_cached,
                 category=self.current_filters['category'],
                 author=self.current_filters['author'],
                 tag=self.current_filters['tag'],
                 search_term=self.current_filters['search_term'],
                 limit=SEARCH_RESULTS_LIMIT
             )
+            self.total_pages = (self.total_results + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
             
-            self.current_page = 0
+            self.page_cursor = None
+            self.prev_cursor_stack = []
+            await self.load_page()
             await self.show_results(interaction)
         except Exception as e:
             print(f"Error updating results for user {self.user_id}: {e}")
             embed = create_embed("❌ Search Error", "An error occurred while searching. Please try again.", COLORS["error"])
             await interaction.edit_original_response(embed=embed, view=self)
     
+    async def load_page(self):
+        """Fetch the page starting at self.page_cursor"""
+        key = (tuple(self.current_filters.values()), self.page_cursor)
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            self._page_cache.move_to_end(key)
+        else:
+            # Runs on a worker thread so other users' interactions keep flowing
+            rows, next_cursor = await search_library_page_async(
+                self.current_filters, self.page_cursor, RESULTS_PER_PAGE
+            )
+            formatted = [format_article(article, show_description=False) + "\n" for article in rows]
+            cached = self._page_cache[key] = (rows, next_cursor, formatted)
+            if len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        
+        self.current_page_rows, self.next_cursor, self.current_formatted = cached
+        self.current_page = len(self.prev_cursor_stack)
+    
+    async def turn_page(self, interaction):
+        """Load and display the page starting at self.page_cursor"""
+        try:
+            await self.load_page()
+            await self.show_results(interaction)
+        except Exception as e:
+            print(f"Error changing page for user {self.user_id}: {e}")
+            embed = create_embed("❌ Search Error", "An error occurred while loading this page. Please try again.", COLORS["error"])
+            await interaction.edit_original_response(embed=embed, view=self)
+    
     async def show_results(self, interaction):
         """Display current results page"""
-        if not self.current_results:
+        self._update_nav_buttons()
+        
+        if not self.current_page_rows:
             embed = create_embed("No Results Found", "Try adjusting your filters.", COLORS["warning"])
             await interaction.edit_original_response(embed=embed, view=self)
             return
         
-        # Pagination
-        start_idx = self.current_page * RESULTS_PER_PAGE
-        end_idx = start_idx + RESULTS_PER_PAGE
-        page_results = self.current_results[start_idx:end_idx]
+        # Re-selecting the same filter or page lands here with nothing new to format
+        key = (tuple(self.current_filters.values()), self.page_cursor, self.total_results)
+        if key == self._results_embed_key:
+            await interaction.edit_original_response(embed=self._results_embed, view=self)
+            return
         
         # Create embed
-        title = f"Library Search Results ({len(self.current_results)} found)"
-        description = ""
+        title = f"Library Search Results ({self.total_results} found)"
+        parts = []  # Joined once at the end instead of repeated string +=
         
         # Show active filters prominently
         active_filters = []
@@ -295,18 +391,17 @@ class LibraryView(discord.ui.View):
             active_filters.append(f"🔍 **\"{self.current_filters['search_term']}\"**")
         
         if active_filters:
-            description += f"🎯 **Active Filters:** {' | '.join(active_filters)}\n\n"
+            parts.append(f"🎯 **Active Filters:** {' | '.join(active_filters)}\n\n")
         
         # Add article results to description
-        for article in page_results:
-            description += format_article(article, show_description=False) + "\n"
+        parts.extend(self.current_formatted)
         
         # Page info
-        total_pages = (len(self.current_results) + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
-        if total_pages > 1:
-            description += f"\n📄 Page {self.current_page + 1} of {total_pages}"
+        if self.total_pages > 1:
+            parts.append(f"\n📄 Page {self.current_page + 1} of {self.total_pages}")
         
-        embed = create_embed(title, description)
+        embed = create_embed(title, "".join(parts))
+        self._results_embed, self._results_embed_key = embed, key
         
         await interaction.edit_original_response(embed=embed, view=self)
     
@@ -321,25 +416,32 @@ class LibraryView(discord.ui.View):
         """Reset all filters and return to welcome page"""
         # Clear all filters
         self.current_filters = {'category': None, 'author': None, 'tag': None, 'search_term': None}
-        self.current_results = []
+        self.current_page_rows = []
+        self.current_formatted = []
         self.current_page = 0
+        self.total_results = 0
+        self.total_pages = 0
+        self.page_cursor = None
+        self.next_cursor = None
+        self.prev_cursor_stack = []
+        self._page_cache.clear()  # Starting over shows fresh data
+        self._results_embed = self._results_embed_key = None
+        self._update_nav_buttons()
         
         # Reset dropdown placeholders to original text
-        for item in self.children:
-            if isinstance(item, discord.ui.Select):
-                if item.custom_id == "category_select":
-                    item.placeholder = "Choose a category..."
-                elif item.custom_id == "author_select":
-                    item.placeholder = "Choose an author..."
-                elif item.custom_id == "tag_select":
-                    item.placeholder = "Choose a tag..."
+        if self.cat_select:
+            self.cat_select.placeholder = "Choose a category..."
+        if self.author_select:
+            self.author_select.placeholder = "Choose an author..."
+        if self.tag_select:
+            self.tag_select.placeholder = "Choose a tag..."
         
         # Return to initial welcome page
-        await interaction.response.defer()
+        await self._acknowledge(interaction)
         
         try:
-            # Get initial stats with fresh connection
-            stats = get_library_stats()
+            # Get initial stats without blocking the event loop
+            stats = await asyncio.to_thread(get_library_stats_cached)
             
             embed = create_embed(
                 "📚 Sacred Community Project Digital Library",
@@ -362,20 +464,20 @@ class LibraryView(discord.ui.View):
     async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Go to previous page"""
         if self.current_page > 0:
-            self.current_page -= 1
-            await interaction.response.defer()
-            await self.show_results(interaction)
+            await self._acknowledge(interaction)
+            self.page_cursor = self.prev_cursor_stack.pop()
+            await self.turn_page(interaction)
         else:
             await interaction.response.send_message("You're already on the first page!", ephemeral=True)
     
     @discord.ui.button(label="▶️ Next", style=discord.ButtonStyle.secondary)
     async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Go to next page"""
-        total_pages = (len(self.current_results) + RESULTS_PER_PAGE - 1) // RESULTS_PER_PAGE
-        if self.current_page < total_pages - 1:
-            self.current_page += 1
-            await interaction.response.defer()
-            await self.show_results(interaction)
+        if self.next_cursor is not None and self.current_page < self.total_pages - 1:
+            await self._acknowledge(interaction)
+            self.prev_cursor_stack.append(self.page_cursor)
+            self.page_cursor = self.next_cursor
+            await self.turn_page(interaction)
         else:
             await interaction.response.send_message("You're already on the last page!", ephemeral=True)
 
@@ -393,6 +495,8 @@ class SearchModal(discord.ui.Modal, title="Search Library"):
     )
     
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+        self.library_view._interaction = interaction  # Edits the library message, like the view's own callbacks
         self.library_view.current_filters['search_term'] = self.search_input.value if self.search_input.value else None
         await self.library_view.update_results(interaction)
 
@@ -402,15 +506,19 @@ async def library_command(interaction: discord.Interaction):
     """Main library browsing command - each interface auto-deletes itself"""
     
     try:
-        db = get_database()
-        if not db.validate_database():
-            embed = create_embed("Database Error", "Library database not found. Please contact an admin.", COLORS["error"])
+        if not _DB_READY:
+            embed = create_embed("Database Error", "Library database is missing or needs an update. Please contact an admin.", COLORS["error"])
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
         # Create user-specific library interface
-        view = LibraryView(interaction.user.id)
-        stats = get_library_stats()
+        try:
+            options = await asyncio.to_thread(get_prebuilt_options)
+        except Exception as e:
+            print(f"Error loading dropdown options: {e}")
+            options = {'categories': [], 'authors': [], 'tags': []}
+        view = LibraryView(interaction.user.id, interaction, options)
+        stats = await asyncio.to_thread(get_library_stats_cached)
         
         embed = create_embed(
             "📚 Sacred Community Project Digital Library",
@@ -424,8 +532,6 @@ async def library_command(interaction: discord.Interaction):
         )
         
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-        # Set the message reference for auto-delete functionality
-        view._message = await interaction.original_response()
         
     except Exception as e:
         print(f"Error in library command for user {interaction.user.id}: {e}")
@@ -441,13 +547,12 @@ async def stats_command(interaction: discord.Interaction):
         return
     
     try:
-        db = get_database()
-        if not db.validate_database():
-            embed = create_embed("Database Error", "Library database not found.", COLORS["error"])
+        if not _DB_READY:
+            embed = create_embed("Database Error", "Library database is missing or needs an update. Run /quick-update-library first.", COLORS["error"])
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        stats = get_library_stats()
+        stats = await asyncio.to_thread(get_library_stats_cached)
         
         embed = create_embed(
             "📊 Library Statistics",
@@ -470,6 +575,7 @@ async def stats_command(interaction: discord.Interaction):
 @bot.tree.command(name="quick-update-library", description="Update library database (Admin only)")
 async def update_library_command(interaction: discord.Interaction):
     """Update library database incrementally"""
+    global _DB_READY
     if not has_admin_role(interaction.user):
         embed = create_embed("Permission Denied", "You need admin permissions to use this command.", COLORS["error"])
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -495,12 +601,7 @@ async def update_library_command(interaction: discord.Interaction):
                 stderr=asyncio.subprocess.PIPE
             )
             
-            try:
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=300)
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                raise TimeoutError("Update took too long")
+            stdout, stderr = await communicate_with_progress(process, interaction, 300, "🔄 Library Update")
             
             returncode = process.returncode
             stdout_text = stdout.decode('utf-8', errors='replace') if stdout else ''
@@ -509,8 +610,11 @@ async def update_library_command(interaction: discord.Interaction):
             if returncode == 0:
                 embed = create_embed("✅ Update Complete", "Library database updated successfully!", COLORS["success"])
                 
-                # Get new stats
-                stats = get_library_stats()
+                # Scraper changed the database - reopen pooled connections and drop cached dropdowns/stats
+                await asyncio.to_thread(get_database().close)
+                invalidate_caches()
+                _DB_READY = await asyncio.to_thread(get_database().validate_database)
+                stats = await asyncio.to_thread(get_library_stats_cached)
                 embed.add_field(name="Current Stats", 
                               value=f"📄 {stats['total_articles']} articles\n"
                                     f"📂 {stats['total_categories']} categories\n"
@@ -529,6 +633,7 @@ async def update_library_command(interaction: discord.Interaction):
 @bot.tree.command(name="rebuild-library", description="Full library rebuild (Admin only)")
 async def refresh_library_command(interaction: discord.Interaction):
     """Full library database refresh"""
+    global _DB_READY
     if not has_admin_role(interaction.user):
         embed = create_embed("Permission Denied", "You need admin permissions to use this command.", COLORS["error"])
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -554,12 +659,7 @@ async def refresh_library_command(interaction: discord.Interaction):
                 stderr=asyncio.subprocess.PIPE
             )
             
-            try:
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=600)
-            except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
-                raise TimeoutError("Refresh took too long")
+            stdout, stderr = await communicate_with_progress(process, interaction, 600, "🔄 Full Refresh")
             
             returncode = process.returncode
             stdout_text = stdout.decode('utf-8', errors='replace') if stdout else ''
@@ -568,8 +668,11 @@ async def refresh_library_command(interaction: discord.Interaction):
             if returncode == 0:
                 embed = create_embed("✅ Refresh Complete", "Full library refresh completed successfully!", COLORS["success"])
                 
-                # Get new stats
-                stats = get_library_stats()
+                # Scraper changed the database - reopen pooled connections and drop cached dropdowns/stats
+                await asyncio.to_thread(get_database().close)
+                invalidate_caches()
+                _DB_READY = await asyncio.to_thread(get_database().validate_database)
+                stats = await asyncio.to_thread(get_library_stats_cached)
                 embed.add_field(name="Updated Stats", 
                               value=f"📄 {stats['total_articles']} articles\n"
                                     f"📂 {stats['total_categories']} categories\n"
@@ -1,5 +1,6 @@
 # config.py
 import os
+import discord
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -10,30 +11,41 @@ DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 if not DISCORD_TOKEN:
     raise ValueError("DISCORD_TOKEN environment variable is required")
 
+# Optional: sync slash commands to this one server (instant) instead of globally
+GUILD_ID = int(os.getenv('GUILD_ID')) if os.getenv('GUILD_ID') else None
+COMMAND_SYNC_FILE = ".command_sync_hash"  # Skip syncing when the command set hasn't changed
+
 # Database Configuration
 DATABASE_PATH = "library_content.db"
+DB_POOL_SIZE = 4  # Connections shared by concurrent commands
 
 # Library Configuration
 LIBRARY_BASE_URL = "https://sacredcommunityproject.org"
 SCRAPER_SCRIPT = "scraper.py"
+SCRAPER_PROGRESS_INTERVAL = 30  # Seconds between "still running" edits during admin updates
 
 # Bot Settings
 COMMAND_PREFIX = "!"
 BOT_DESCRIPTION = "Digital Library Assistant for Sacred Community Project"
 
 # Admin Settings
-ADMIN_ROLE_NAMES = ["Admin", "Moderator", "Library Manager"]  # Roles that can run update commands
+ADMIN_ROLE_NAMES = frozenset({"Admin", "Moderator", "Library Manager"})  # Roles that can run update commands
 
 # Interface Settings
 MAX_DROPDOWN_OPTIONS = 25  # Discord limit
 RESULTS_PER_PAGE = 5
 SEARCH_RESULTS_LIMIT = 20
 
-# Colors for embeds (hex colors)
+# Cache Settings
+CACHE_TTL_SECONDS = 300  # Dropdown options and stats only change when the scraper runs
+PAGE_CACHE_SIZE = 32  # Result pages each library view keeps for revisited filters/pages
+
+# Colors for embeds - built once as Colour objects so each Embed doesn't convert the int
 COLORS = {
-    "primary": 0x5865F2,      # Discord blue
-    "success": 0x57F287,      # Green
-    "warning": 0xFEE75C,      # Yellow
-    "error": 0xED4245,        # Red
-    "info": 0x5865F2          # Blue
+    "primary": discord.Colour(0x5865F2),      # Discord blue
+    "secondary": discord.Colour(0x99AAB5),    # Grey
+    "success": discord.Colour(0x57F287),      # Green
+    "warning": discord.Colour(0xFEE75C),      # Yellow
+    "error": discord.Colour(0xED4245),        # Red
+    "info": discord.Colour(0x5865F2)          # Blue
 }
\ No newline at end of file
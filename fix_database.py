@@ -11,4 +11,24 @@ try:
 except Exception as e:
     print(f"Column might already exist: {e}")
 
-conn.close()
\ No newline at end of file
+conn.close()
+
+# Bring the rest of the schema up to date: Scraper's setup adds newer columns (ADDED_COLUMNS),
+# replaces 'Unknown'/'[]' sentinels with NULL and builds the stats/facets tables, indexes
+# and full-text search
+from scraper import Scraper
+scraper = Scraper(db_path='library_content.db')
+
+# Backfill the pre-joined tags for any rows still missing them
+cursor = scraper.conn.cursor()
+cursor.execute('''
+    UPDATE library_content
+    SET tags_display = (SELECT group_concat(value, ', ') FROM json_each(library_content.tags))
+    WHERE tags_display IS NULL AND json_valid(tags) AND json_array_length(tags) > 0
+''')
+scraper.conn.commit()
+print(f"✅ Filled tags_display for {cursor.rowcount} rows")
+cursor.close()
+
+scraper.update_library_stats()  # Fill library_facets and library_meta for existing rows
+scraper.close()
@@ -1,225 +1,608 @@
 # queries.py
+import os
+import sys
 import sqlite3
-import json
+import pathlib
+import time
+import asyncio
+import queue
+import threading
+import functools
+import contextlib
 from typing import List, Dict, Tuple, Optional
-from config import DATABASE_PATH
+from config import DATABASE_PATH, DB_POOL_SIZE, CACHE_TTL_SECONDS
+from schema import CATEGORY_SPLIT_CTE, ADDED_COLUMNS
+
+class _ConnectionPool:
+    """A few long-lived SQLite connections shared by the bot's worker threads"""
+    
+    def __init__(self, connect, size: int):
+        self._connect = connect
+        # None marks a slot whose connection hasn't been opened yet
+        self._slots = queue.Queue()
+        for _ in range(size):
+            self._slots.put(None)
+        self._generation = 0  # Bumped by close_all; stale connections are closed on release
+        self._local = threading.local()
+    
+    @contextlib.contextmanager
+    def acquire(self):
+        """Check out a connection for this thread (nested calls reuse the same one)"""
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            yield held
+            return
+        
+        slot = self._slots.get()  # Blocks while every connection is in use
+        try:
+            if slot is None or slot[1] != self._generation:
+                if slot is not None:
+                    slot[0].close()
+                slot = (self._connect(), self._generation)
+        except BaseException:
+            self._slots.put(None)
+            raise
+        
+        self._local.conn = slot[0]
+        try:
+            yield slot[0]
+        finally:
+            self._local.conn = None
+            if slot[1] == self._generation:
+                self._slots.put(slot)
+            else:
+                slot[0].close()
+                self._slots.put(None)
+    
+    def current(self):
+        """The connection checked out by this thread"""
+        return self._local.conn
+    
+    def close_all(self):
+        """Close idle connections now and in-use ones as they are released"""
+        self._generation += 1
+        idle = []
+        while True:
+            try:
+                idle.append(self._slots.get_nowait())
+            except queue.Empty:
+                break
+        for slot in idle:
+            if slot is not None:
+                slot[0].close()
+            self._slots.put(None)
+
+def _pooled(method):
+    """Run a LibraryDatabase method with a pooled connection checked out"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._pool.acquire():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _interned_row(cursor, row):
+    """Row factory for search_content: interns the low-cardinality categories/author values
+    
+    Results repeat a handful of category and author strings, so rows across searches share them.
+    """
+    row = list(row)
+    for i in (3, 4):  # categories, author - see the SELECT in search_content
+        if row[i]:
+            row[i] = sys.intern(row[i])
+    return sqlite3.Row(cursor, tuple(row))
+
+# Trigram full-text search can't match terms shorter than this; those are prefix searches
+FTS_MIN_TERM_LENGTH = 3
+
+# bm25 column weights for keyword search, in library_fts column order:
+# title, author, categories, description, tags
+FTS_RANK_WEIGHTS = '10.0, 5.0, 2.0, 1.0, 2.0'
 
 class LibraryDatabase:
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        self.has_fts = False
+        # The bot queries from worker threads (asyncio.to_thread); each checks out its own connection
+        self._pool = _ConnectionPool(self._open_connection, DB_POOL_SIZE)
+    
+    def _open_connection(self):
+        """Open a pooled connection and apply per-connection settings"""
+        # Queries are built from fixed fragments, so each filter combination always yields the
+        # same SQL text and is prepared once per connection then reused from this cache
+        # The bot only reads; read-only connections never contend with the scraper for the
+        # write lock. The scraper owns the schema and puts the database in WAL mode.
+        uri = pathlib.Path(self.db_path).absolute().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        # Applied once per connection; the page cache survives between queries
+        conn.executescript('''
+            PRAGMA cache_size=-32000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA busy_timeout=5000;
+        ''')
+        # The scraper creates library_fts; older databases only support LIKE search
+        self.has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'library_fts'"
+        ).fetchone() is not None
+        return conn
     
     def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get the connection checked out for the running method (see _pooled)"""
+        return self._pool.current()
+    
+    def close(self):
+        """Close pooled connections; the next query reopens them (e.g. after the scraper ran)"""
+        self._pool.close_all()
+    
+    def _facet_values(self, cursor, kind: str, top: Optional[int] = None) -> Optional[List[str]]:
+        """Read values the scraper precomputed in library_facets (None if not built yet)"""
+        try:
+            if top:
+                cursor.execute('''
+                    SELECT value FROM library_facets WHERE kind = ?
+                    ORDER BY count DESC, value LIMIT ?
+                ''', (kind, top))
+            else:
+                cursor.execute('SELECT value FROM library_facets WHERE kind = ? ORDER BY value', (kind,))
+        except sqlite3.OperationalError:
+            return None  # Database predates library_facets
+        
+        return [row[0] for row in cursor.fetchall()] or None
     
+    @_pooled
     def get_all_categories(self) -> List[str]:
         """Get all unique categories from the database"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                SELECT DISTINCT categories 
-                FROM library_content 
-                WHERE scrape_success = 1 AND categories != "Uncategorized"
-                ORDER BY categories
-            ''')
+            categories = self._facet_values(cursor, 'category')
+            if categories is not None:
+                return categories
             
-            all_categories = set()
-            for row in cursor.fetchall():
-                if row[0]:
-                    # Split comma-separated categories
-                    categories = [cat.strip() for cat in row[0].split(',')]
-                    all_categories.update(categories)
+            cursor.execute(CATEGORY_SPLIT_CTE + '''
+                SELECT DISTINCT value FROM category_split
+                WHERE value != ''
+                ORDER BY value
+            ''')
             
-            return sorted(list(all_categories))
+            return [row[0] for row in cursor.fetchall()]
             
         finally:
-            conn.close()
+            cursor.close()
     
+    @_pooled
     def get_all_authors(self) -> List[str]:
         """Get all unique authors from the database"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
+            authors = self._facet_values(cursor, 'author')
+            if authors is not None:
+                return authors
+            
             cursor.execute('''
                 SELECT DISTINCT author 
                 FROM library_content 
-                WHERE scrape_success = 1 AND author != "Unknown"
+                WHERE scrape_success = 1 AND author IS NOT NULL
                 ORDER BY author
             ''')
             
             return [row[0] for row in cursor.fetchall()]
             
         finally:
-            conn.close()
+            cursor.close()
     
+    @_pooled
     def get_all_tags_with_counts(self) -> List[str]:
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
+            tags = self._facet_values(cursor, 'tag', top=24)
+            if tags is not None:
+                return sorted(tags)
+            
+            # Explode the JSON arrays and count in SQLite rather than decoding every row in Python
             cursor.execute('''
-                SELECT tags FROM library_content 
-                WHERE scrape_success = 1 AND tags != "[]"
+                SELECT tag.value, COUNT(*) AS uses
+                FROM library_content, json_each(library_content.tags) AS tag
+                WHERE scrape_success = 1 AND tags IS NOT NULL AND json_valid(tags)
+                GROUP BY tag.value
+                ORDER BY uses DESC, tag.value
+                LIMIT 24
             ''')
             
-            tag_counts = {}
-            for row in cursor.fetchall():
-                if row[0]:
-                    try:
-                        tags = json.loads(row[0])
-                        for tag in tags:
-                            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-                    except json.JSONDecodeError:
-                        continue
-            
-            # Get top 24 most popular tags
-            sorted_by_popularity = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-            top_24_tags = [tag for tag, count in sorted_by_popularity[:24]]
-        
-            # Sort those 24 alphabetically for display
-            return sorted(top_24_tags)
+            # Top 24 most popular tags, sorted alphabetically for display
+            return sorted(row[0] for row in cursor.fetchall())
             
         finally:
-            conn.close()
+            cursor.close()
+    
+    def _can_match(self, text: str) -> bool:
+        """Whether a substring filter can use the trigram index instead of LIKE"""
+        return self.has_fts and len(text) >= FTS_MIN_TERM_LENGTH
+    
+    @staticmethod
+    def _fts_phrase(text: str) -> str:
+        """Quote text as an FTS5 phrase so user input is never parsed as query syntax"""
+        return '"' + text.replace('"', '""') + '"'
+    
+    @staticmethod
+    def _like_escape(text: str) -> str:
+        """Escape LIKE wildcards so user input only matches literally"""
+        return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    
+    def _filter_parts(self,
+                      category: Optional[str] = None,
+                      author: Optional[str] = None,
+                      tag: Optional[str] = None,
+                      search_term: Optional[str] = None) -> Tuple[str, List, Optional[str]]:
+        """Build the WHERE clause and the combined FTS MATCH expression (or None) for the filters"""
+        where = 'WHERE scrape_success = 1'
+        params = []
+        # Substring filters go through the trigram index when they're long enough;
+        # they're ANDed into a single MATCH so the index is probed once
+        matches = []
+        
+        if category and self._can_match(category):
+            matches.append('categories : ' + self._fts_phrase(category))
+        elif category:
+            where += ' AND categories LIKE ?'
+            params.append(f'%{category}%')
+        
+        if author:
+            where += ' AND author = ?'
+            params.append(author)
+        
+        if tag:
+            # Exact element match - tag values come from the dropdown. Compared after JSON
+            # decoding, since the stored text escapes non-ASCII and quotes (so no FTS phrase)
+            where += ' AND EXISTS (SELECT 1 FROM json_each(library_content.tags) WHERE value = ?)'
+            params.append(tag)
+        
+        if search_term and self._can_match(search_term):
+            matches.append(self._fts_phrase(search_term))
+        elif search_term and len(search_term) < FTS_MIN_TERM_LENGTH:
+            # One or two characters match almost everything as a substring; treat them as a
+            # title/author prefix, which the NOCASE indexes can answer without a scan
+            where += " AND (title LIKE ? ESCAPE '\\' OR author LIKE ? ESCAPE '\\')"
+            prefix_param = self._like_escape(search_term) + '%'
+            params.extend([prefix_param, prefix_param])
+        elif search_term:
+            where += ' AND (title LIKE ? OR categories LIKE ? OR author LIKE ? OR tags LIKE ? OR description LIKE ?)'
+            search_param = f'%{search_term}%'
+            params.extend([search_param, search_param, search_param, search_param, search_param])
+        
+        return where, params, ' AND '.join(matches) or None
+    
+    def _build_filters(self,
+                       category: Optional[str] = None,
+                       author: Optional[str] = None,
+                       tag: Optional[str] = None,
+                       search_term: Optional[str] = None) -> Tuple[str, List]:
+        """Build the WHERE clause shared by search_content and count_content"""
+        where, params, match = self._filter_parts(category, author, tag, search_term)
+        
+        if match:
+            where += ' AND id IN (SELECT rowid FROM library_fts WHERE library_fts MATCH ?)'
+            params.append(match)
+        
+        return where, params
     
+    @_pooled
     def search_content(self, 
                       category: Optional[str] = None,
                       author: Optional[str] = None, 
                       tag: Optional[str] = None,
                       search_term: Optional[str] = None,
-                      limit: int = 20) -> List[Dict]:
-        """Search library content with filters"""
+                      limit: int = 20,
+                      after: Optional[Tuple] = None) -> List[sqlite3.Row]:
+        """Search library content with filters
+        
+        Keyword searches (search_term long enough for the index) are ordered by relevance,
+        everything else newest first. Pass the _page_cursor() of the last row of a page as
+        `after` to get the next page (keyset pagination, no OFFSET). Rows carry the
+        listing columns only; descriptions are never shown in result lists.
+        """
+        if search_term and self._can_match(search_term):
+            return self._search_ranked(category, author, tag, search_term, limit, after)
+        
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
             # Build query dynamically based on filters
-            query = '''
-                SELECT url, title, categories, author, published_date, tags, description
+            where, params = self._build_filters(category, author, tag, search_term)
+            query = f'''
+                SELECT id, url, title, categories, author, published_date, scraped_at, tags_display
                 FROM library_content 
-                WHERE scrape_success = 1
+                {where}
             '''
-            params = []
             
-            if category:
-                query += ' AND categories LIKE ?'
-                params.append(f'%{category}%')
+            if after:
+                query += ' AND (published_date, scraped_at, id) < (?, ?, ?)'
+                params.extend(after)
             
-            if author:
-                query += ' AND author = ?'
-                params.append(author)
+            query += ' ORDER BY published_date DESC, scraped_at DESC, id DESC LIMIT ?'
+            params.append(limit)
+            
+            # sqlite3.Row is a single C object per row that still supports article['title'] lookups
+            cursor.row_factory = _interned_row
+            cursor.execute(query, params)
+            return cursor.fetchall()
             
-            if tag:
-                query += ' AND tags LIKE ?'
-                params.append(f'%"{tag}"%')  # JSON search
+        finally:
+            cursor.close()
+    
+    def _search_ranked(self, category, author, tag, search_term, limit, after) -> List[sqlite3.Row]:
+        """Keyword search ordered by bm25 relevance (best first); `after` is a (rank, -id) cursor"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where, params, match = self._filter_parts(category, author, tag, search_term)
+            # Rank inside the index, then join the articles; the subquery exposes only rowid/rank
+            # so the shared WHERE clause's bare column names still mean library_content's
+            query = f'''
+                SELECT id, url, title, categories, author, published_date, scraped_at,
+                       tags_display, ranked.rank AS rank
+                FROM (
+                    SELECT rowid, bm25(library_fts, {FTS_RANK_WEIGHTS}) AS rank
+                    FROM library_fts WHERE library_fts MATCH ?
+                ) AS ranked
+                JOIN library_content ON library_content.id = ranked.rowid
+                {where}
+            '''
+            params.insert(0, match)
             
-            if search_term:
-                query += ' AND (title LIKE ? OR categories LIKE ? OR author LIKE ? OR tags LIKE ? OR description LIKE ?)'
-                search_param = f'%{search_term}%'
-                params.extend([search_param, search_param, search_param, search_param, search_param])
+            if after:
+                query += ' AND (ranked.rank, -id) > (?, ?)'
+                params.extend(after)
             
-            query += ' ORDER BY published_date DESC, scraped_at DESC LIMIT ?'
+            # bm25 scores are negative, lower is a better match; equal scores list newer rows first
+            query += ' ORDER BY ranked.rank, id DESC LIMIT ?'
             params.append(limit)
             
+            cursor.row_factory = _interned_row
             cursor.execute(query, params)
+            return cursor.fetchall()
             
-            results = []
-            for row in cursor.fetchall():
-                url, title, categories, author, published_date, tags, description = row
-                
-                # Parse tags JSON
-                try:
-                    parsed_tags = json.loads(tags) if tags else []
-                except json.JSONDecodeError:
-                    parsed_tags = []
-                
-                results.append({
-                    'url': url,
-                    'title': title,
-                    'categories': categories,
-                    'author': author,
-                    'published_date': published_date,
-                    'tags': parsed_tags,
-                    'description': description or ''
-                })
-            
-            return results
+        finally:
+            cursor.close()
+    
+    async def search_content_async(self, *args, **kwargs) -> List[sqlite3.Row]:
+        """search_content on a worker thread, so the bot's event loop never blocks on SQLite
+        
+        Each concurrent call checks out its own pooled connection.
+        """
+        return await asyncio.to_thread(self.search_content, *args, **kwargs)
+    
+    @_pooled
+    def count_content(self,
+                      category: Optional[str] = None,
+                      author: Optional[str] = None,
+                      tag: Optional[str] = None,
+                      search_term: Optional[str] = None,
+                      limit: int = 20) -> int:
+        """Count matching articles, stopping at limit"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            where, params = self._build_filters(category, author, tag, search_term)
+            cursor.execute(f'SELECT COUNT(*) FROM (SELECT 1 FROM library_content {where} LIMIT ?)', params + [limit])
+            return cursor.fetchone()[0]
             
         finally:
-            conn.close()
+            cursor.close()
     
+    @_pooled
     def get_content_stats(self) -> Dict:
         """Get overall library statistics"""
         conn = self.get_connection()
         cursor = conn.cursor()
         
         try:
-            # Total articles
-            cursor.execute('SELECT COUNT(*) FROM library_content WHERE scrape_success = 1')
-            total_articles = cursor.fetchone()[0]
-            
-            # Unique categories
-            categories = self.get_all_categories()
+            # One round-trip when the scraper has built library_facets
+            try:
+                cursor.execute('''
+                    SELECT
+                        (SELECT COUNT(*) FROM library_content WHERE scrape_success = 1),
+                        (SELECT COUNT(*) FROM library_facets WHERE kind = 'category'),
+                        (SELECT COUNT(*) FROM library_facets WHERE kind = 'author'),
+                        MIN((SELECT COUNT(*) FROM library_facets WHERE kind = 'tag'), 24),
+                        (SELECT MAX(scraped_at) FROM library_content),
+                        EXISTS (SELECT 1 FROM library_facets)
+                ''')
+                total_articles, total_categories, total_authors, total_tags, last_update, has_facets = cursor.fetchone()
+            except sqlite3.OperationalError:
+                has_facets = False  # Database predates library_facets
             
-            # Unique authors
-            authors = self.get_all_authors()
+            if has_facets:
+                return {
+                    'total_articles': total_articles,
+                    'total_categories': total_categories,
+                    'total_authors': total_authors,
+                    'total_tags': total_tags,  # Tags shown in the dropdown (top 24)
+                    'last_update': last_update
+                }
             
-            # Unique tags
-            tags = self.get_all_tags_with_counts()
-            
-            # Last update
-            cursor.execute('SELECT MAX(scraped_at) FROM library_content')
-            last_update = cursor.fetchone()[0]
+            # No facets yet: aggregate the distinct counts in SQL rather than building the lists
+            cursor.execute(CATEGORY_SPLIT_CTE + '''
+                SELECT
+                    (SELECT COUNT(*) FROM library_content WHERE scrape_success = 1),
+                    (SELECT COUNT(DISTINCT value) FROM category_split WHERE value != ''),
+                    (SELECT COUNT(DISTINCT author) FROM library_content
+                     WHERE scrape_success = 1 AND author IS NOT NULL),
+                    MIN((SELECT COUNT(DISTINCT tag.value)
+                         FROM library_content, json_each(library_content.tags) AS tag
+                         WHERE scrape_success = 1 AND tags IS NOT NULL AND json_valid(tags)), 24),
+                    (SELECT MAX(scraped_at) FROM library_content)
+            ''')
+            total_articles, total_categories, total_authors, total_tags, last_update = cursor.fetchone()
             
             return {
                 'total_articles': total_articles,
-                'total_categories': len(categories),
-                'total_authors': len(authors),
-                'total_tags': len(tags),
+                'total_categories': total_categories,
+                'total_authors': total_authors,
+                'total_tags': total_tags,
                 'last_update': last_update
             }
             
         finally:
-            conn.close()
+            cursor.close()
     
-    def get_recent_content(self, limit: int = 10) -> List[Dict]:
+    def get_recent_content(self, limit: int = 10) -> List[sqlite3.Row]:
         """Get most recently added content"""
         return self.search_content(limit=limit)
     
+    @_pooled
+    def get_stats_snapshot(self) -> Optional[Dict]:
+        """Read the statistics the scraper stored in library_meta (None if not written yet)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT key, value FROM library_meta')
+            meta = dict(cursor.fetchall())
+        except sqlite3.OperationalError:
+            return None  # Database predates library_meta
+        finally:
+            cursor.close()
+        
+        if 'total_articles' not in meta:
+            return None
+        
+        return {
+            'total_articles': int(meta['total_articles']),
+            'total_categories': int(meta['total_categories']),
+            'total_authors': int(meta['total_authors']),
+            'total_tags': int(meta['total_tags']),
+            'last_update': meta['last_update']
+        }
+    
     def validate_database(self) -> bool:
         """Check if database exists and has content"""
+        if not os.path.exists(self.db_path):
+            return False  # Connecting would create an empty database file
+        
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM library_content WHERE scrape_success = 1')
-            count = cursor.fetchone()[0]
-            
-            conn.close()
-            return count > 0
+            with self._pool.acquire() as conn:
+                cursor = conn.cursor()
+                
+                # The bot can't migrate a read-only database, and every search selects tags_display
+                cursor.execute('PRAGMA table_info(library_content)')
+                existing = {row[1] for row in cursor.fetchall()}
+                missing = [column for column, _ in ADDED_COLUMNS if column not in existing]
+                if existing and missing:
+                    cursor.close()
+                    print(f"❌ Database is missing columns: {', '.join(missing)}. "
+                          f"Run `python scraper.py --update` (or fix_database.py) to migrate it first.")
+                    return False
+                
+                # Stops at the first scraped article (idx_lc_listing) instead of counting them all
+                cursor.execute('SELECT EXISTS (SELECT 1 FROM library_content WHERE scrape_success = 1)')
+                has_content = cursor.fetchone()[0]
+                
+                cursor.close()
+            return bool(has_content)
             
         except sqlite3.Error:
             return False
 
+# Shared database for the bot process (its connection pool lives as long as the bot)
+_DB = None
+
+def get_database():
+    """Get the shared LibraryDatabase instance"""
+    global _DB
+    if _DB is None:
+        _DB = LibraryDatabase()
+    return _DB
+
 # Convenience functions for bot commands
-def get_library_stats():
+def get_library_stats(db=None):
     """Quick function to get library statistics"""
-    db = LibraryDatabase()
-    return db.get_content_stats()
+    db = db or get_database()
+    # Prefer the scraper's snapshot; fall back to live aggregates for older databases
+    return db.get_stats_snapshot() or db.get_content_stats()
 
-def search_library(category=None, author=None, tag=None, search_term=None, limit=20):
+def search_library(category=None, author=None, tag=None, search_term=None, limit=20, after=None, db=None):
     """Quick function to search library"""
-    db = LibraryDatabase()
-    return db.search_content(category, author, tag, search_term, limit)
+    db = db or get_database()
+    return db.search_content(category, author, tag, search_term, limit, after)
+
+def _page_cursor(article):
+    """Keyset cursor for an article row - pass as `after` to fetch the rows that follow it"""
+    if 'rank' in article.keys():  # Relevance-ordered keyword search
+        return (article['rank'], -article['id'])
+    return (article['published_date'], article['scraped_at'], article['id'])
+
+async def search_library_page_async(filters, cursor=None, limit=5, db=None):
+    """Fetch one page of results for a filters dict (category/author/tag/search_term)
+    
+    Returns (rows, next_cursor); next_cursor is None on the last page. Callers only
+    ever hold one page of rows plus cursors.
+    """
+    db = db or get_database()
+    # One extra row tells us whether another page follows without a second query
+    rows = await db.search_content_async(filters['category'], filters['author'], filters['tag'],
+                                         filters['search_term'], limit + 1, cursor)
+    if len(rows) > limit:
+        return rows[:limit], _page_cursor(rows[limit - 1])
+    return rows, None
 
-def get_dropdown_options():
+def get_dropdown_options(db=None):
     """Get options for Discord dropdowns"""
-    db = LibraryDatabase()
+    db = db or get_database()
     return {
         'categories': db.get_all_categories()[:25],  # Discord limit
         'authors': db.get_all_authors()[:25],
         'tags': db.get_all_tags_with_counts()[:25]
-    }
\ No newline at end of file
+    }
+
+# In-process caches - library content only changes when the scraper runs
+_DROPDOWN_CACHE = {"data": None, "ts": 0.0}
+_STATS_CACHE = {"data": None, "ts": 0.0}
+_COUNT_CACHE = {}  # (category, author, tag, search_term, limit) -> (ts, count)
+_COUNT_CACHE_MAX = 256
+
+def get_dropdown_options_cached(ttl=CACHE_TTL_SECONDS):
+    """Get dropdown options, re-querying the database at most once per ttl seconds"""
+    now = time.monotonic()
+    if _DROPDOWN_CACHE["data"] is None or now - _DROPDOWN_CACHE["ts"] > ttl:
+        _DROPDOWN_CACHE["data"] = get_dropdown_options()
+        _DROPDOWN_CACHE["ts"] = now
+    return _DROPDOWN_CACHE["data"]
+
+def get_library_stats_cached(ttl=CACHE_TTL_SECONDS):
+    """Get library statistics, re-querying the database at most once per ttl seconds"""
+    now = time.monotonic()
+    if _STATS_CACHE["data"] is None or now - _STATS_CACHE["ts"] > ttl:
+        _STATS_CACHE["data"] = get_library_stats()
+        _STATS_CACHE["ts"] = now
+    return _STATS_CACHE["data"]
+
+def count_library_cached(category=None, author=None, tag=None, search_term=None, limit=20, ttl=CACHE_TTL_SECONDS):
+    """Count search results per filter set, re-querying at most once per ttl seconds"""
+    key = (category, author, tag, search_term, limit)
+    now = time.monotonic()
+    cached = _COUNT_CACHE.get(key)
+    if cached is not None and now - cached[0] <= ttl:
+        return cached[1]
+    
+    count = get_database().count_content(category, author, tag, search_term, limit)
+    if len(_COUNT_CACHE) >= _COUNT_CACHE_MAX:
+        _COUNT_CACHE.clear()  # Free-text searches make keys unbounded; just start over
+    _COUNT_CACHE[key] = (now, count)
+    return count
+
+def invalidate_caches():
+    """Drop cached dropdown options, stats and counts (call after the scraper updates the database)"""
+    _DROPDOWN_CACHE["data"] = None
+    _DROPDOWN_CACHE["ts"] = 0.0
+    _STATS_CACHE["data"] = None
+    _STATS_CACHE["ts"] = 0.0
+    _COUNT_CACHE.clear()
@@ -0,0 +1,24 @@
+# schema.py
+# SQL shared by the scraper (writer) and queries.py (the bot's reader). Kept free of
+# imports and side effects so the bot can use it without loading the scraper.
+
+# Splits the comma-separated categories column into (id, value) rows inside SQLite
+CATEGORY_SPLIT_CTE = '''
+    WITH RECURSIVE category_split(id, value, rest) AS (
+        SELECT id, '', categories || ',' FROM library_content
+        WHERE scrape_success = 1 AND categories != "Uncategorized"
+        UNION ALL
+        SELECT id, TRIM(substr(rest, 1, instr(rest, ',') - 1)), substr(rest, instr(rest, ',') + 1)
+        FROM category_split WHERE rest != ''
+    )
+'''
+
+# Columns added to library_content after databases were already deployed. The scraper's
+# setup_database adds whichever ones an existing database is missing; the bot opens the
+# database read-only, so it refuses to serve one that hasn't been migrated yet
+ADDED_COLUMNS = (
+    ('tags_display', 'TEXT'),
+    ('etag', 'TEXT'),
+    ('http_last_modified', 'TEXT'),
+    ('content_hash', 'TEXT'),
+)
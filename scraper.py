@@ -1,15 +1,20 @@
 # scraper.py
 import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer
 import sqlite3
 import json
+import hashlib
 import xml.etree.ElementTree as ET
-from datetime import datetime
+from datetime import date, datetime
 import time
 import re
+from collections import Counter
 from urllib.parse import urljoin, urlparse
 import os
 import sys
+from schema import CATEGORY_SPLIT_CTE, ADDED_COLUMNS
 
 # Fix Windows console encoding for emojis
 os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -20,6 +25,88 @@ if sys.platform.startswith('win'):
     if hasattr(sys.stderr, 'buffer'):
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'replace')
 
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+SITEMAP_URL_TAG = f'{SITEMAP_NS}url'
+SITEMAP_SITEMAP_TAG = f'{SITEMAP_NS}sitemap'
+SITEMAP_LOC_TAG = f'{SITEMAP_NS}loc'
+SITEMAP_LASTMOD_TAG = f'{SITEMAP_NS}lastmod'
+
+# extract_metadata only reads these elements (and their contents), so article pages
+# are parsed without the head, scripts, nav and footer markup around them
+ARTICLE_STRAINER = SoupStrainer(['h1', 'div', 'time', 'blockquote'])
+
+# Archive listing entries and the "older" pagination link; the rest of the page
+# (nav, footer, scripts) is never built
+ARCHIVE_STRAINER = SoupStrainer(class_=['blog-basic-grid--container', 'older'])
+
+# Archive listing dates ("7/19/25"); parsed by hand since strptime is slow per call
+ARCHIVE_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2})')
+
+# Written by flush_data. Kept as constants so every batch passes sqlite3 the identical
+# string and reuses its compiled statement from the connection's statement cache.
+# Upsert rather than INSERT OR REPLACE: REPLACE deletes the old row without
+# firing delete triggers, which would leave stale entries in library_fts
+UPSERT_ARTICLE_SQL = '''
+    INSERT INTO library_content 
+    (url, title, categories, author, published_date, tags, tags_display, description, last_modified, etag, http_last_modified, content_hash, scrape_success)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        title = excluded.title,
+        categories = excluded.categories,
+        author = excluded.author,
+        published_date = excluded.published_date,
+        tags = excluded.tags,
+        tags_display = excluded.tags_display,
+        description = excluded.description,
+        last_modified = excluded.last_modified,
+        etag = excluded.etag,
+        http_last_modified = excluded.http_last_modified,
+        content_hash = excluded.content_hash,
+        scrape_success = excluded.scrape_success,
+        scraped_at = CURRENT_TIMESTAMP
+'''
+# For pages that haven't changed (304, or same content_hash): only bookkeeping columns move on,
+# keeping the stored validators when the response didn't carry new ones
+TOUCH_ARTICLE_SQL = '''
+    UPDATE library_content
+    SET last_modified = ?, etag = COALESCE(?, etag), http_last_modified = COALESCE(?, http_last_modified),
+        scraped_at = CURRENT_TIMESTAMP
+    WHERE url = ?
+'''
+
+# Fields compared to tell whether a re-fetched page changed. published_date is left out: it
+# usually comes from the archive listing, which an incremental run doesn't always walk
+HASHED_FIELDS = ('title', 'categories', 'author', 'tags', 'description', 'scrape_success')
+
+# Paragraphs containing these are adverts, not descriptions
+PROMO_WORDS = ('order', 'buy', 'purchase', 'copy today')
+
+NOT_MODIFIED = object()  # scrape_page result for a page the server says is unchanged
+
+class RateLimiter:
+    """Token bucket shared by concurrent fetches: bursts of up to `burst` requests, then `rate` per second"""
+    
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 class Scraper:
     def __init__(self, base_url="https://sacredcommunityproject.org", db_path="library_content.db"):
         self.base_url = base_url
@@ -28,8 +115,15 @@ class Scraper:
             f"{base_url}/sitemap.xml",
             f"{base_url}/sitemap.index.xml"
         ]
-        self.request_delay = 1.5  # Seconds between requests
+        self.request_delay = 1.5  # Seconds per request per worker; caps the overall rate at concurrency / request_delay
+        self.concurrency = 8  # Article pages fetched at once (and the rate limiter's burst size)
         self.max_retries = 3
+        # Articles live at /digital-library/<slug>; category, tag and filtered
+        # (?author=...) listing pages do not count
+        self._article_re = re.compile(r'^(?!.*(?:category/|tag/|\?|&author=|/digital-library/?$)).*/digital-library/.')
+        self.batch_size = 500  # Articles written per transaction
+        self._pending = []  # Rows queued by store_data
+        self._unchanged = []  # (lastmod, etag, http_last_modified, url) of pages that didn't change
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; LibraryBot/1.0)'
@@ -44,16 +138,41 @@ class Scraper:
             'pages_scraped': 0,
             'errors': 0,
             'start_time': None,
-            'dates_extracted': 0
+            'dates_extracted': 0,
+            'not_modified': 0,  # Pages the server answered 304 for
+            'unchanged_content': 0  # Pages re-sent in full with the same content
         }
         
+        # One connection for the whole run; pragmas and page cache persist between writes
+        self.conn = self.connect()
         self.setup_database()
     
+    def connect(self):
+        """Open a database connection with the scraper's write settings"""
+        conn = sqlite3.connect(self.db_path)
+        # WAL (set once in setup_database, persistent) only needs NORMAL sync to stay consistent;
+        # wait for the bot's readers instead of failing with "database is locked"
+        conn.executescript('''
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        ''')
+        return conn
+    
+    def close(self):
+        """Close the scraper's database connection"""
+        self.conn.close()
+    
     def setup_database(self):
         """Create database and tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
+        # auto_vacuum only takes effect on a new database; journal_mode=WAL is stored in the file
+        cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
         # Main content table - add description column
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS library_content (
@@ -64,12 +183,18 @@ class Scraper:
                 author TEXT,
                 published_date TEXT,
                 tags TEXT,
+                tags_display TEXT,
                 description TEXT,
                 last_modified TEXT,
+                etag TEXT,
+                http_last_modified TEXT,
+                content_hash TEXT,
                 scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 scrape_success BOOLEAN DEFAULT TRUE
             )
         ''')
+        self.add_missing_columns(cursor)
+        self.clear_legacy_sentinels(cursor)
         
         # Scraping log table
         cursor.execute('''
@@ -84,114 +209,209 @@ class Scraper:
             )
         ''')
         
+        # Stats snapshot read by the bot instead of running aggregates per command
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS library_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+        
+        # Distinct categories/authors/tags with article counts, so the bot's dropdowns
+        # are a small indexed read instead of a scan of library_content
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS library_facets (
+                kind TEXT NOT NULL,
+                value TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (kind, value)
+            )
+        ''')
+        # Most-used first, so the top-N tag read stops after N index entries instead of sorting
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_facets_popular
+            ON library_facets(kind, count DESC, value)
+        ''')
+        
+        # Indexes matching the bot's listing order (newest first), so a page is an index
+        # walk that stops at LIMIT instead of sorting every match; the rowid covers the id tiebreak.
+        # idx_lc_listing also serves the scrape_success counts and show_sample_data's ordering,
+        # and url lookups use the UNIQUE constraint's index, so neither needs its own index
+        cursor.execute('DROP INDEX IF EXISTS idx_lc_author')  # Superseded by idx_lc_author_listing
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_lc_listing
+            ON library_content(scrape_success, published_date, scraped_at)
+        ''')
+        # Short search terms are title/author prefix matches (LIKE 'x%' needs NOCASE indexes)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_lc_title_nocase ON library_content(title COLLATE NOCASE)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_lc_author_nocase ON library_content(author COLLATE NOCASE)')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_lc_author_listing
+            ON library_content(author, published_date, scraped_at) WHERE scrape_success = 1
+        ''')
+        
+        self.setup_search_index(cursor)
+        
         conn.commit()
-        conn.close()
         print(f"✅ Database setup complete: {self.db_path}")
     
+    def add_missing_columns(self, cursor):
+        """Bring an older library_content table up to the current schema"""
+        cursor.execute('PRAGMA table_info(library_content)')
+        existing = {row[1] for row in cursor.fetchall()}
+        
+        for column, column_type in ADDED_COLUMNS:
+            if column in existing:
+                continue
+            cursor.execute(f'ALTER TABLE library_content ADD COLUMN {column} {column_type}')
+            print(f"✅ Added {column} column to database")
+            
+            if column == 'tags_display':
+                # Pre-join the tags of rows scraped before the column existed
+                cursor.execute('''
+                    UPDATE library_content
+                    SET tags_display = (SELECT group_concat(value, ', ') FROM json_each(library_content.tags))
+                    WHERE json_valid(tags) AND json_array_length(tags) > 0
+                ''')
+    
+    def clear_legacy_sentinels(self, cursor):
+        """Turn the 'Unknown' author and '[]' tags older scrapes stored into NULL (a no-op once done)"""
+        # Facets, filters and stats treat a missing author/tags as NULL only
+        cursor.execute("UPDATE library_content SET author = NULL WHERE author = 'Unknown'")
+        authors = cursor.rowcount
+        cursor.execute("UPDATE library_content SET tags = NULL WHERE tags = '[]'")
+        if authors or cursor.rowcount:
+            print(f"✅ Replaced {authors} 'Unknown' authors and {cursor.rowcount} '[]' tags with NULL")
+    
+    def setup_search_index(self, cursor):
+        """Create the FTS5 index the bot uses for keyword search, kept in sync by triggers"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'library_fts'")
+        if cursor.fetchone():
+            self.setup_search_update_trigger(cursor)
+            return
+        
+        try:
+            # Trigram tokenizer keeps the substring semantics of the old LIKE '%term%' search
+            cursor.execute('''
+                CREATE VIRTUAL TABLE library_fts USING fts5(
+                    title, author, categories, description, tags,
+                    content='library_content', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Full-text search unavailable, bot will fall back to LIKE search: {e}")
+            return
+        
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS library_fts_ai AFTER INSERT ON library_content BEGIN
+                INSERT INTO library_fts (rowid, title, author, categories, description, tags)
+                VALUES (new.id, new.title, new.author, new.categories, new.description, new.tags);
+            END;
+            CREATE TRIGGER IF NOT EXISTS library_fts_ad AFTER DELETE ON library_content BEGIN
+                INSERT INTO library_fts (library_fts, rowid, title, author, categories, description, tags)
+                VALUES ('delete', old.id, old.title, old.author, old.categories, old.description, old.tags);
+            END;
+        ''')
+        self.setup_search_update_trigger(cursor)
+        
+        # Index any articles scraped before the FTS table existed
+        cursor.execute("INSERT INTO library_fts (library_fts) VALUES ('rebuild')")
+        print("🔎 Built full-text search index")
+    
+    def setup_search_update_trigger(self, cursor):
+        """(Re)create the FTS update trigger so it only fires when an indexed column is written"""
+        # Touching lastmod/etag/scraped_at on unchanged pages shouldn't reindex the article
+        cursor.executescript('''
+            DROP TRIGGER IF EXISTS library_fts_au;
+            CREATE TRIGGER library_fts_au
+            AFTER UPDATE OF title, author, categories, description, tags ON library_content BEGIN
+                INSERT INTO library_fts (library_fts, rowid, title, author, categories, description, tags)
+                VALUES ('delete', old.id, old.title, old.author, old.categories, old.description, old.tags);
+                INSERT INTO library_fts (rowid, title, author, categories, description, tags)
+                VALUES (new.id, new.title, new.author, new.categories, new.description, new.tags);
+            END;
+        ''')
+    
     def is_article_url(self, url):
         """Determine if URL is an actual article (not category/tag/author page)"""
-        
-        # Must contain /digital-library/
-        if '/digital-library' not in url:
-            return False
-            
-        # Exclude main library page
-        if url.endswith('/digital-library') or url.endswith('/digital-library/'):
-            return False
-            
-        # Exclude category pages: /digital-library/category/something
-        if '/digital-library/category/' in url:
-            return False
-            
-        # Exclude tag pages: /digital-library/tag/something  
-        if '/digital-library/tag/' in url:
-            return False
-            
-        # Exclude author pages: /digital-library?author=123
-        if '?author=' in url or '&author=' in url:
-            return False
-            
-        # Exclude other filter pages with query parameters
-        if '/digital-library?' in url:
-            return False
-            
-        # If it contains /digital-library/ followed by content, it's likely an article
-        # Pattern: /digital-library/article-title-here
-        if '/digital-library/' in url and not any(x in url for x in ['category/', 'tag/', '?']):
-            return True
-            
-        return False
+        return self._article_re.match(url) is not None
     
     def get_all_urls_from_sitemap(self):
         """Parse sitemap(s) and extract all URLs"""
         all_urls = []
         
+        async def read_all(sitemap_urls):
+            # Each read is a blocking streamed GET + iterparse, so run them side by side in threads
+            semaphore = asyncio.Semaphore(self.concurrency)
+            
+            async def read(sitemap_url):
+                async with semaphore:
+                    return await asyncio.to_thread(self._read_sitemap, sitemap_url)
+            
+            return await asyncio.gather(*(read(url) for url in sitemap_urls), return_exceptions=True)
+        
         for sitemap_url in self.sitemap_urls:
             print(f"📄 Checking sitemap: {sitemap_url}")
-            
-            try:
-                response = self.session.get(sitemap_url, timeout=30)
-                response.raise_for_status()
-                
-                # Parse XML
-                root = ET.fromstring(response.content)
-                
-                # Handle both regular sitemaps and sitemap index files
-                if 'sitemapindex' in root.tag:
-                    # This is a sitemap index, get individual sitemaps
-                    for sitemap in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}sitemap'):
-                        loc = sitemap.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                        if loc is not None:
-                            sub_urls = self.parse_individual_sitemap(loc.text)
-                            all_urls.extend(sub_urls)
-                else:
-                    # This is a regular sitemap
-                    urls = self.parse_individual_sitemap(sitemap_url)
-                    all_urls.extend(urls)
-                    
-            except Exception as e:
-                print(f"❌ Error reading sitemap {sitemap_url}: {e}")
+        
+        sub_sitemaps = []
+        for sitemap_url, result in zip(self.sitemap_urls, asyncio.run(read_all(self.sitemap_urls))):
+            if isinstance(result, Exception):
+                print(f"❌ Error reading sitemap {sitemap_url}: {result}")
+                continue
+            urls, nested = result
+            all_urls.extend(urls)
+            # A sitemap index lists further sitemaps rather than pages
+            sub_sitemaps.extend(nested)
+        
+        if sub_sitemaps:
+            for sitemap_url, result in zip(sub_sitemaps, asyncio.run(read_all(sub_sitemaps))):
+                if isinstance(result, Exception):
+                    print(f"❌ Error parsing sitemap {sitemap_url}: {result}")
+                    continue
+                all_urls.extend(result[0])
         
         self.stats['urls_found'] = len(all_urls)
         print(f"📊 Total URLs found in sitemap: {len(all_urls)}")
         
         return all_urls
     
-    def parse_individual_sitemap(self, sitemap_url):
-        """Parse a single sitemap file"""
+    def _read_sitemap(self, sitemap_url):
+        """Stream a sitemap, returning its page URLs and any nested sitemap URLs"""
         urls = []
+        sub_sitemaps = []
         
+        response = self.session.get(sitemap_url, timeout=30, stream=True)
         try:
-            response = self.session.get(sitemap_url, timeout=30)
             response.raise_for_status()
+            response.raw.decode_content = True  # Undo gzip transfer encoding
             
-            root = ET.fromstring(response.content)
-            
-            for url_elem in root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}url'):
-                loc = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                lastmod = url_elem.find('{http://www.sitemaps.org/schemas/sitemap/0.9}lastmod')
-                
-                if loc is not None:
-                    url_data = {
-                        'url': loc.text,
-                        'lastmod': lastmod.text if lastmod is not None else None
-                    }
-                    urls.append(url_data)
-        
-        except Exception as e:
-            print(f"❌ Error parsing sitemap {sitemap_url}: {e}")
+            # Handle each <url>/<sitemap> as it closes and then drop it, so the
+            # whole document is never held in memory at once
+            for _, elem in ET.iterparse(response.raw, events=('end',)):
+                if elem.tag == SITEMAP_URL_TAG:
+                    loc = elem.findtext(SITEMAP_LOC_TAG)
+                    if loc:
+                        urls.append({
+                            'url': loc.strip(),
+                            'lastmod': elem.findtext(SITEMAP_LASTMOD_TAG)
+                        })
+                    elem.clear()
+                elif elem.tag == SITEMAP_SITEMAP_TAG:
+                    loc = elem.findtext(SITEMAP_LOC_TAG)
+                    if loc:
+                        sub_sitemaps.append(loc.strip())
+                    elem.clear()
+        finally:
+            response.close()
         
-        return urls
+        return urls, sub_sitemaps
     
     def filter_article_urls(self, all_urls):
         """Filter URLs to only include actual articles"""
-        article_urls = []
-        
         print("🔍 Filtering URLs to find actual articles...")
         
-        for url_data in all_urls:
-            if self.is_article_url(url_data['url']):
-                article_urls.append(url_data)
+        is_article = self._article_re.match
+        article_urls = [url_data for url_data in all_urls if is_article(url_data['url'])]
         
         self.stats['articles_found'] = len(article_urls)
         
@@ -211,14 +431,16 @@ class Scraper:
             content_area = soup.find('div', class_='sqs-html-content')
             
             if content_area:
-                # Get all paragraphs
-                paragraphs = content_area.find_all('p')
+                # Walk paragraphs lazily so the search stops at the first usable one
+                paragraphs = (tag for tag in content_area.descendants if tag.name == 'p')
                 
                 for p in paragraphs:
                     text = p.get_text(strip=True)
                     # Skip very short paragraphs, empty ones, and promotional content
-                    if (len(text) > 50 and 
-                        not any(word in text.lower() for word in ['order', 'buy', 'purchase', 'copy today'])):
+                    if len(text) <= 50:
+                        continue
+                    lowered = text.lower()  # Once per paragraph, not once per promo word
+                    if not any(word in lowered for word in PROMO_WORDS):
                         # Return first 300 characters as description
                         return text[:300] + "..." if len(text) > 300 else text
             
@@ -234,85 +456,241 @@ class Scraper:
             print(f"   ⚠️  Error extracting description: {e}")
             return ""
 
-    def scrape_dates_from_archives(self):
-        """Scrape dates from archive pages for better sorting"""
+    async def scrape_archive_dates(self, session, dates):
+        """Walk the archive pages into dates (runs alongside the article scrape)"""
         print("📅 Extracting dates from archive pages...")
-        dates = {}  # URL -> date mapping
         
-        archive_url = f"{self.base_url}/digital-library"
+        # Pages come one after another (each links to the next), at most one per request_delay
+        limiter = RateLimiter(1 / self.request_delay, 1)
         page_count = 0
         
-        while archive_url and page_count < 50:  # Safety limit
+        archive_url = f"{self.base_url}/digital-library"
+        next_page = asyncio.create_task(self.fetch_archive_page(session, limiter, archive_url))
+        
+        while next_page and page_count < 50:  # Safety limit
             try:
                 print(f"   📄 Archive page {page_count + 1}: {archive_url}")
-                response = self.session.get(archive_url, timeout=30)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                html = await next_page
+                next_page = None
                 
-                articles = soup.find_all('article', class_='blog-basic-grid--container')
-                print(f"   Found {len(articles)} articles on this page")
+                # Squarespace's "older" link carries a timestamp cursor rather than a page
+                # number, so later pages can't be requested up front; the single parse
+                # (off the event loop) yields both this page's dates and the next link
+                older_href = await asyncio.to_thread(self.extract_archive_dates, html, dates)
+                page_count += 1
                 
-                for article in articles:
-                    # Extract URL
-                    title_link = article.find('h1', class_='blog-title')
-                    if title_link:
-                        link_tag = title_link.find('a')
-                        if link_tag and link_tag.has_attr('href'):
-                            url = f"{self.base_url}{link_tag.get('href')}"
-                            
-                            # Extract date from archive listing
-                            date_element = article.find('time', class_='blog-date')
-                            if date_element:
-                                date_text = date_element.get_text(strip=True)
-                                # Convert "7/19/25" to "2025-07-19" format for sorting
-                                try:
-                                    parsed_date = datetime.strptime(date_text, '%m/%d/%y')
-                                    formatted_date = parsed_date.strftime('%Y-%m-%d')
-                                    dates[url] = formatted_date
-                                    self.stats['dates_extracted'] += 1
-                                except ValueError:
-                                    # Try alternative formats if needed
-                                    dates[url] = date_text  # Keep original if parsing fails
-                                    print(f"   ⚠️  Could not parse date '{date_text}' for {url}")
+                if older_href and page_count < 50:
+                    archive_url = f"{self.base_url}{older_href}"
+                    next_page = asyncio.create_task(self.fetch_archive_page(session, limiter, archive_url))
                 
-                # Find next page
-                older_posts = soup.find('div', class_='older')
-                if older_posts and older_posts.find('a'):
-                    next_href = older_posts.find('a').get('href')
-                    archive_url = f"{self.base_url}{next_href}"
-                    page_count += 1
-                    time.sleep(self.request_delay)
-                else:
-                    archive_url = None
-                    
             except Exception as e:
                 print(f"❌ Error scraping archive page {page_count + 1}: {e}")
                 break
         
-        print(f"✅ Extracted {len(dates)} dates from {page_count + 1} archive pages")
-        return dates
+        if next_page:
+            next_page.cancel()
+        
+        print(f"✅ Extracted {len(dates)} dates from {page_count} archive pages")
+    
+    async def fetch_archive_page(self, session, limiter, archive_url):
+        """Download one archive page"""
+        await limiter.acquire()
+        async with session.get(archive_url) as response:
+            response.raise_for_status()
+            return await response.read()
+    
+    def extract_archive_dates(self, html, dates):
+        """Add the URL -> date entries listed on one archive page to dates; returns the older-posts href or None"""
+        soup = BeautifulSoup(html, 'lxml', parse_only=ARCHIVE_STRAINER)
+        
+        articles = soup.find_all('article', class_='blog-basic-grid--container')
+        print(f"   Found {len(articles)} articles on this page")
+        
+        for article in articles:
+            # Extract URL
+            title_link = article.find('h1', class_='blog-title')
+            if title_link:
+                link_tag = title_link.find('a')
+                if link_tag and link_tag.has_attr('href'):
+                    url = f"{self.base_url}{link_tag.get('href')}"
+                    
+                    # Extract date from archive listing
+                    date_element = article.find('time', class_='blog-date')
+                    if date_element:
+                        date_text = date_element.get_text(strip=True)
+                        # Convert "7/19/25" to "2025-07-19" format for sorting
+                        try:
+                            dates[url] = self.format_archive_date(date_text)
+                            self.stats['dates_extracted'] += 1
+                        except ValueError:
+                            # Try alternative formats if needed
+                            dates[url] = date_text  # Keep original if parsing fails
+                            print(f"   ⚠️  Could not parse date '{date_text}' for {url}")
+        
+        older = soup.find('div', class_='older')
+        older_link = older.find('a') if older else None
+        return older_link.get('href') if older_link else None
     
-    def scrape_page(self, url_data):
-        """Scrape a single page and extract metadata"""
+    def format_archive_date(self, date_text):
+        """Convert an archive listing date ("7/19/25") to "2025-07-19"; raises ValueError if it isn't one"""
+        match = ARCHIVE_DATE_RE.fullmatch(date_text)
+        if not match:
+            return datetime.strptime(date_text, '%m/%d/%y').strftime('%Y-%m-%d')
+        
+        # Same century pivot as strptime's %y: 69-99 are 1900s, 00-68 are 2000s
+        month, day, year = map(int, match.groups())
+        year += 2000 if year < 69 else 1900
+        return date(year, month, day).isoformat()  # date() still rejects 2/30 etc.
+    
+    def client_session(self):
+        """aiohttp session with the scraper's User-Agent, request timeout and a keep-alive pool"""
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        # Room for every article worker plus the archive walker, with idle
+        # connections kept open so each request skips a fresh TCP/TLS handshake
+        connector = aiohttp.TCPConnector(limit=self.concurrency + 1, keepalive_timeout=30)
+        return aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=30), connector=connector)
+    
+    async def scrape_page(self, session, semaphore, limiter, url_data):
+        """Fetch a single page and extract metadata; returns (url_data, data or None)"""
         url = url_data['url']
         
+        # Revalidate pages we already have, so unchanged ones come back as an empty 304
+        # (one round trip, where a HEAD preflight would cost a second one for changed pages)
+        headers = {}
+        if url_data.get('etag'):
+            headers['If-None-Match'] = url_data['etag']
+        if url_data.get('http_last_modified'):
+            headers['If-Modified-Since'] = url_data['http_last_modified']
+        
         for attempt in range(self.max_retries):
             try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
+                async with semaphore:
+                    await limiter.acquire()
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304:
+                            return url_data, NOT_MODIFIED
+                        response.raise_for_status()
+                        etag = response.headers.get('ETag')
+                        http_last_modified = response.headers.get('Last-Modified')
+                        charset = response.charset  # From Content-Type; None if not declared
+                        html = await response.read()
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                data = self.extract_metadata(soup, url_data)
+                # Parse off the event loop so other downloads keep flowing meanwhile
+                data = await asyncio.to_thread(self.parse_article, html, url_data, charset)
+                data['etag'] = etag
+                data['http_last_modified'] = http_last_modified
                 
-                return data
+                return url_data, data
                 
             except Exception as e:
                 print(f"❌ Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < self.max_retries - 1:
-                    time.sleep(2)  # Wait before retry
+                    await asyncio.sleep(2)  # Wait before retry
                 else:
                     self.stats['errors'] += 1
-                    return None
+                    return url_data, None
+    
+    def parse_article(self, html, url_data, charset=None):
+        """Parse an article page and extract its metadata"""
+        # The raw bytes go straight to lxml, which decodes them as it parses; a known
+        # charset spares BeautifulSoup sniffing (and possibly re-decoding) the whole page
+        soup = BeautifulSoup(html, 'lxml', parse_only=ARTICLE_STRAINER, from_encoding=charset)
+        data = self.extract_metadata(soup, url_data)
+        data['content_hash'] = self.content_hash(data)
+        return data
+    
+    def content_hash(self, data):
+        """Hash of the extracted fields, so a re-fetched page can be compared with the stored row"""
+        # Hashing what we store (not the raw HTML) ignores volatile markup like timestamps or tokens
+        fields = json.dumps([data.get(field) for field in HASHED_FIELDS], ensure_ascii=False)
+        return hashlib.sha256(fields.encode('utf-8')).hexdigest()
+    
+    async def scrape_articles(self, session, article_urls):
+        """Scrape article pages concurrently, storing each as it arrives; returns the success count"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # Same average rate as each slot sleeping request_delay, without the idle gap after every page
+        limiter = RateLimiter(self.concurrency / self.request_delay, self.concurrency)
+        successful_scrapes = 0
+        
+        tasks = [self.scrape_page(session, semaphore, limiter, url_data) for url_data in article_urls]
+        
+        try:
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                url_data, data = await task
+                print(f"📄 [{i}/{len(article_urls)}] {url_data['url']}")
+                
+                if data is NOT_MODIFIED:
+                    # Body unchanged; only the stored sitemap lastmod needs moving on
+                    self._unchanged.append((url_data.get('lastmod'), None, None, url_data['url']))
+                    self.stats['not_modified'] += 1
+                    print("   ⏭️  Not modified since last scrape")
+                elif data and data['content_hash'] == url_data.get('content_hash'):
+                    # Served again (new ETag/date) but nothing we store changed - skip the rewrite
+                    self._unchanged.append((url_data.get('lastmod'), data['etag'], data['http_last_modified'], url_data['url']))
+                    self.stats['unchanged_content'] += 1
+                    print("   ⏭️  Content unchanged since last scrape")
+                elif data:
+                    # Queue for the database (written in batches)
+                    self.store_data(data)
+                    self.stats['pages_scraped'] += 1
+                    
+                    # Show progress for successful scrapes
+                    if data['scrape_success'] and data['title'] != 'No title found':
+                        successful_scrapes += 1
+                        description_display = data['description'][:50] + "..." if len(data['description']) > 50 else data['description']
+                        date_display = data['published_date']
+                        print(f"   ✅ {data['title'][:30]}... | {date_display} | {description_display}")
+                    else:
+                        print(f"   ⚠️  Issue with this page - check if it's really an article")
+                
+                # Progress update every 10 pages
+                if i % 10 == 0:
+                    elapsed = (datetime.now() - self.stats['start_time']).total_seconds() / 60
+                    success_rate = (successful_scrapes / i) * 100
+                    print(f"📊 Progress: {i}/{len(article_urls)} ({i/len(article_urls)*100:.1f}%) - {success_rate:.1f}% success rate - {elapsed:.1f} min elapsed")
+        finally:
+            self.flush_data()  # Keep what was scraped even if the run is interrupted
+        
+        return successful_scrapes
+    
+    async def scrape_articles_with_dates(self, article_urls):
+        """Scrape articles while the archive dates are collected alongside; returns the success count"""
+        # Articles scraped once their archive date is known get it straight away
+        # (extract_metadata reads the map); the rest are corrected afterwards
+        self.archive_dates_map = {}
+        
+        # One session (and connection pool) for the whole run, shared by both walkers
+        async with self.client_session() as session:
+            archive_task = asyncio.create_task(self.scrape_archive_dates(session, self.archive_dates_map))
+            
+            try:
+                successful_scrapes = await self.scrape_articles(session, article_urls)
+            finally:
+                await archive_task
+        
+        self.backfill_archive_dates(article_urls)
+        return successful_scrapes
+    
+    def backfill_archive_dates(self, article_urls):
+        """Apply archive dates that arrived after their article was already stored"""
+        dates = self.archive_dates_map
+        rows = [(dates[url_data['url']], url_data['url'], dates[url_data['url']])
+                for url_data in article_urls if url_data['url'] in dates]
+        
+        conn = self.conn
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany(
+                'UPDATE library_content SET published_date = ? WHERE url = ? AND published_date IS NOT ?',
+                rows
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ Error applying archive dates: {e}")
+        finally:
+            cursor.close()
     
     def extract_metadata(self, soup, url_data):
         """Extract metadata from HTML with improved category and date handling"""
@@ -337,13 +715,13 @@ class Scraper:
             else:
                 data['categories'] = 'Uncategorized'
             
-            # Author
+            # Author (NULL rather than a sentinel string when missing)
             author_element = soup.find('div', {'data-content-field': 'author'})
             if author_element:
                 author_link = author_element.find('a')
-                data['author'] = author_link.text.strip() if author_link else 'Unknown'
+                data['author'] = author_link.text.strip() if author_link else None
             else:
-                data['author'] = 'Unknown'
+                data['author'] = None
             
             # Date - enhanced to use archive date if available
             date_element = soup.find('time', {'data-content-field': 'published-on'})
@@ -362,9 +740,11 @@ class Scraper:
             if tags_element:
                 tag_links = tags_element.find_all('a', class_='blog-item-tag')
                 tags = [tag.text.strip() for tag in tag_links]
-                data['tags'] = json.dumps(tags)
             else:
-                data['tags'] = json.dumps([])
+                tags = []
+            data['tags'] = json.dumps(tags) if tags else None  # NULL rather than '[]' when untagged
+            # Ready-to-display copy so the bot never parses/joins tags per render
+            data['tags_display'] = ', '.join(tags) or None
             
             # Description - extract first substantial paragraph
             data['description'] = self.extract_description(soup)
@@ -381,34 +761,168 @@ class Scraper:
         return data
     
     def store_data(self, data):
-        """Store data in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        """Queue data for the database; written in batches by flush_data"""
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO library_content 
-                (url, title, categories, author, published_date, tags, description, last_modified, scrape_success)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self._pending.append((
                 data['url'],
                 data['title'],
                 data['categories'],
                 data['author'],
                 data['published_date'],
                 data['tags'],
+                data['tags_display'],
                 data['description'],
                 data['last_modified'],
+                data.get('etag'),
+                data.get('http_last_modified'),
+                data.get('content_hash'),
                 data['scrape_success']
             ))
+        except KeyError as e:
+            print(f"❌ Error storing data: missing {e}")
+            return
+        
+        if len(self._pending) >= self.batch_size:
+            self.flush_data()
+    
+    def flush_data(self):
+        """Write queued articles in one transaction"""
+        if not self._pending and not self._unchanged:
+            return
+        
+        conn = self.conn
+        cursor = conn.cursor()
+        
+        try:
+            cursor.executemany(TOUCH_ARTICLE_SQL, self._unchanged)
+            facet_delta = self.facet_changes(cursor, self._pending)
+            cursor.executemany(UPSERT_ARTICLE_SQL, self._pending)
+            
+            # Keep library_facets current in the same transaction, touching only this batch's values
+            cursor.executemany('''
+                INSERT INTO library_facets (kind, value, count) VALUES (?, ?, ?)
+                ON CONFLICT(kind, value) DO UPDATE SET count = count + excluded.count
+            ''', [(kind, value, change) for (kind, value), change in facet_delta.items() if change])
+            cursor.execute('DELETE FROM library_facets WHERE count <= 0')
             
             conn.commit()
             
         except Exception as e:
-            print(f"❌ Error storing data: {e}")
+            conn.rollback()
+            print(f"❌ Error storing {len(self._pending)} articles: {e}")
         
         finally:
-            conn.close()
+            self._pending = []
+            self._unchanged = []
+            cursor.close()
+    
+    def facet_changes(self, cursor, rows):
+        """Per-facet count changes from replacing the stored versions of rows (UPSERT_ARTICLE_SQL tuples)"""
+        latest = {row[0]: row for row in rows}  # A URL queued twice only counts once
+        delta = Counter()
+        if not latest:
+            return delta
+        
+        cursor.execute(f'''
+            SELECT categories, author, tags FROM library_content
+            WHERE scrape_success = 1 AND url IN ({', '.join('?' * len(latest))})
+        ''', list(latest))
+        for categories, author, tags in cursor:
+            delta.subtract(self.article_facets(categories, author, tags))
+        
+        for url, title, categories, author, published_date, tags, *_, scrape_success in latest.values():
+            if scrape_success:
+                delta.update(self.article_facets(categories, author, tags))
+        
+        return delta
+    
+    def article_facets(self, categories, author, tags):
+        """(kind, value) pairs one article counts towards, split the same way as update_library_stats"""
+        facets = []
+        if categories and categories != 'Uncategorized':
+            facets.extend(('category', value) for value in {part.strip(' ') for part in categories.split(',')} if value)
+        if author is not None:
+            facets.append(('author', author))
+        if tags:
+            try:
+                facets.extend(('tag', tag) for tag in json.loads(tags))
+            except ValueError:
+                pass
+        return facets
+    
+    def update_library_stats(self, rebuild_facets=True):
+        """Store library statistics in library_meta for the bot, rebuilding library_facets unless told not to"""
+        conn = self.conn
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute('SELECT COUNT(*) FROM library_content WHERE scrape_success = 1')
+            total_articles = cursor.fetchone()[0]
+            
+            cursor.execute('SELECT MAX(scraped_at) FROM library_content')
+            last_update = cursor.fetchone()[0]
+            
+            # flush_data keeps the facets current, so incremental runs skip the full rescan
+            # (unless the table has never been built)
+            cursor.execute('SELECT 1 FROM library_facets LIMIT 1')
+            if rebuild_facets or (total_articles and cursor.fetchone() is None):
+                self._rebuild_facets(cursor)
+            
+            cursor.execute('SELECT kind, COUNT(*) FROM library_facets GROUP BY kind')
+            facet_totals = dict(cursor.fetchall())
+            
+            stats = {
+                'total_articles': total_articles,
+                'total_categories': facet_totals.get('category', 0),
+                'total_authors': facet_totals.get('author', 0),
+                'total_tags': min(facet_totals.get('tag', 0), 24),  # Same as the bot: tags shown in the dropdown
+                'last_update': last_update
+            }
+            
+            cursor.executemany('''
+                INSERT INTO library_meta (key, value) VALUES (?, ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            ''', [(key, None if value is None else str(value)) for key, value in stats.items()])
+            
+            conn.commit()
+            cursor.execute('ANALYZE')  # Fresh planner statistics for the bot's filtered queries
+            # Return pages freed by the facets rebuild. executescript steps the pragma to completion;
+            # execute() would free a single page. Only databases created with auto_vacuum=INCREMENTAL
+            # (or VACUUMed once since) have pages to return - elsewhere this is a no-op
+            conn.executescript('PRAGMA incremental_vacuum;')
+            print(f"📊 Library stats updated: {stats['total_articles']} articles, "
+                  f"{stats['total_categories']} categories, {stats['total_authors']} authors")
+            
+        except Exception as e:
+            conn.rollback()  # Don't leave the facets half-rebuilt for the next commit
+            print(f"❌ Error updating library stats: {e}")
+        
+        finally:
+            cursor.close()
+    
+    def _rebuild_facets(self, cursor):
+        """Recount library_facets from every stored article"""
+        cursor.execute('DELETE FROM library_facets')
+        # Categories are stored comma-separated; the shared recursive CTE splits them in SQLite
+        cursor.execute(CATEGORY_SPLIT_CTE + '''
+            INSERT INTO library_facets (kind, value, count)
+            SELECT 'category', value, COUNT(DISTINCT id) FROM category_split
+            WHERE value != ''
+            GROUP BY value
+        ''')
+        cursor.execute('''
+            INSERT INTO library_facets (kind, value, count)
+            SELECT 'author', author, COUNT(*) FROM library_content
+            WHERE scrape_success = 1 AND author IS NOT NULL
+            GROUP BY author
+        ''')
+        cursor.execute('''
+            INSERT INTO library_facets (kind, value, count)
+            SELECT 'tag', tag.value, COUNT(*)
+            FROM library_content, json_each(library_content.tags) AS tag
+            WHERE scrape_success = 1 AND tags IS NOT NULL AND json_valid(tags)
+            GROUP BY tag.value
+        ''')
     
     def check_for_updates(self):
         """Check for new or updated articles without scraping"""
@@ -422,29 +936,35 @@ class Scraper:
             print("❌ No article URLs found.")
             return []
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
+        # One pass over the table instead of a lookup per sitemap URL
+        try:
+            cursor.execute('SELECT url, last_modified, etag, http_last_modified, content_hash FROM library_content')
+            stored = {row[0]: row[1:] for row in cursor}
+        finally:
+            cursor.close()
+        
         new_articles = []
         updated_articles = []
         
         for url_data in article_urls:
-            cursor.execute('SELECT last_modified, scraped_at FROM library_content WHERE url = ?', (url_data['url'],))
-            result = cursor.fetchone()
-            
-            if result is None:
+            if url_data['url'] not in stored:
                 # New article we haven't seen before
                 new_articles.append(url_data)
             else:
-                stored_lastmod = result[0]
+                stored_lastmod, stored_etag, stored_http_lastmod, stored_hash = stored[url_data['url']]
                 sitemap_lastmod = url_data.get('lastmod')
                 
                 # If lastmod is newer or different, we need to update
                 if sitemap_lastmod and sitemap_lastmod != stored_lastmod:
+                    # Validators that let scrape_page skip bodies that didn't change
+                    url_data['etag'] = stored_etag
+                    url_data['http_last_modified'] = stored_http_lastmod
+                    url_data['content_hash'] = stored_hash  # Lets scrape_articles skip identical rewrites
                     updated_articles.append(url_data)
         
-        conn.close()
-        
         print(f"🆕 New articles found: {len(new_articles)}")
         print(f"📝 Articles to update: {len(updated_articles)}")
         
@@ -476,40 +996,14 @@ class Scraper:
         
         if not articles_to_update:
             print("✅ Library is up to date! No changes needed.")
+            self.update_library_stats(rebuild_facets=False)
             return
         
-        # Extract dates from archives for better dating
-        print("📅 Extracting dates from archive pages first...")
-        self.archive_dates_map = self.scrape_dates_from_archives()
-        
-        print(f"📍 Scraping {len(articles_to_update)} articles...")
-        print(f"⏱️  Estimated time: {(len(articles_to_update) * self.request_delay) / 60:.1f} minutes")
+        # Archive dates (better dating) are extracted alongside the article scrape
+        print(f"📍 Scraping {len(articles_to_update)} articles and archive dates...")
+        print(f"⏱️  Estimated time: {(len(articles_to_update) * self.request_delay) / self.concurrency / 60:.1f} minutes")
         
-        successful_scrapes = 0
-        
-        for i, url_data in enumerate(articles_to_update, 1):
-            print(f"📄 [{i}/{len(articles_to_update)}] {url_data['url']}")
-            
-            # Scrape page
-            data = self.scrape_page(url_data)
-            
-            if data:
-                # Store in database
-                self.store_data(data)
-                self.stats['pages_scraped'] += 1
-                
-                # Show progress for successful scrapes
-                if data['scrape_success'] and data['title'] != 'No title found':
-                    successful_scrapes += 1
-                    categories_display = data['categories'][:50] + "..." if len(data['categories']) > 50 else data['categories']
-                    description_display = data['description'][:50] + "..." if len(data['description']) > 50 else data['description']
-                    date_display = data['published_date']
-                    print(f"   ✅ {data['title'][:30]}... | {date_display} | {description_display}")
-                else:
-                    print(f"   ⚠️  Issue with this page")
-            
-            # Rate limiting
-            time.sleep(self.request_delay)
+        successful_scrapes = asyncio.run(self.scrape_articles_with_dates(articles_to_update))
         
         # Summary
         duration = (datetime.now() - self.stats['start_time']).total_seconds() / 60
@@ -519,16 +1013,19 @@ class Scraper:
         print("=" * 60)
         print(f"📄 Articles updated: {len(articles_to_update)}")
         print(f"✅ Successful: {successful_scrapes}")
+        print(f"⏭️  Not modified (304): {self.stats['not_modified']}")
+        print(f"♻️  Unchanged content: {self.stats['unchanged_content']}")
         print(f"📅 Dates extracted: {self.stats['dates_extracted']}")
         print(f"❌ Errors: {self.stats['errors']}")
         print(f"⏱️  Duration: {duration:.1f} minutes")
         
         # Log to database
         self.log_incremental_update(len(articles_to_update), successful_scrapes, duration)
+        self.update_library_stats(rebuild_facets=False)
     
     def log_incremental_update(self, articles_updated, successful, duration):
         """Log incremental update to database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # Add incremental update log table if it doesn't exist
@@ -554,7 +1051,6 @@ class Scraper:
         ''', (total_articles, articles_updated, successful, duration, 'incremental'))
         
         conn.commit()
-        conn.close()
     
     def run_full_scrape(self):
         """Run complete scraping process with improved filtering and date extraction"""
@@ -579,48 +1075,15 @@ class Scraper:
             print("❌ No article URLs found after filtering.")
             return
         
-        # Step 3: Extract dates from archive pages
-        print("📍 Step 3: Extracting dates from archive pages...")
-        self.archive_dates_map = self.scrape_dates_from_archives()
+        # Step 3: Scrape all article pages, extracting archive dates alongside
+        print(f"📍 Step 3: Scraping {len(article_urls)} article pages and archive dates...")
+        print(f"⏱️  Estimated time: {(len(article_urls) * self.request_delay) / self.concurrency / 60:.1f} minutes")
         
-        # Step 4: Scrape all article pages
-        print(f"📍 Step 4: Scraping {len(article_urls)} article pages...")
-        print(f"⏱️  Estimated time: {(len(article_urls) * self.request_delay) / 60:.1f} minutes")
+        asyncio.run(self.scrape_articles_with_dates(article_urls))
         
-        successful_scrapes = 0
-        
-        for i, url_data in enumerate(article_urls, 1):
-            print(f"📄 [{i}/{len(article_urls)}] {url_data['url']}")
-            
-            # Scrape page
-            data = self.scrape_page(url_data)
-            
-            if data:
-                # Store in database
-                self.store_data(data)
-                self.stats['pages_scraped'] += 1
-                
-                # Show progress for successful scrapes
-                if data['scrape_success'] and data['title'] != 'No title found':
-                    successful_scrapes += 1
-                    categories_display = data['categories'][:50] + "..." if len(data['categories']) > 50 else data['categories']
-                    description_display = data['description'][:50] + "..." if len(data['description']) > 50 else data['description']
-                    date_display = data['published_date']
-                    print(f"   ✅ {data['title'][:30]}... | {date_display} | {description_display}")
-                else:
-                    print(f"   ⚠️  Issue with this page - check if it's really an article")
-            
-            # Rate limiting
-            time.sleep(self.request_delay)
-            
-            # Progress update every 10 pages
-            if i % 10 == 0:
-                elapsed = (datetime.now() - self.stats['start_time']).total_seconds() / 60
-                success_rate = (successful_scrapes / i) * 100
-                print(f"📊 Progress: {i}/{len(article_urls)} ({i/len(article_urls)*100:.1f}%) - {success_rate:.1f}% success rate - {elapsed:.1f} min elapsed")
-        
-        # Step 5: Summary
+        # Step 4: Summary
         self.log_scraping_session()
+        self.update_library_stats()
         self.print_summary()
         self.show_sample_data()
     
@@ -628,7 +1091,7 @@ class Scraper:
         """Log scraping session to database"""
         duration = (datetime.now() - self.stats['start_time']).total_seconds() / 60
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -643,7 +1106,6 @@ class Scraper:
         ))
         
         conn.commit()
-        conn.close()
     
     def print_summary(self):
         """Print scraping summary"""
@@ -665,7 +1127,7 @@ class Scraper:
     
     def show_sample_data(self):
         """Show sample of scraped data"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.conn
         cursor = conn.cursor()
         
         # Get successful scrapes ordered by date
@@ -687,7 +1149,7 @@ class Scraper:
             
             print(f"Title: {title}")
             print(f"Categories: {categories}")
-            print(f"Author: {author}")
+            print(f"Author: {author or 'Unknown'}")
             print(f"Date: {date}")
             print(f"Tags: {', '.join(tags_list[:3])}{'...' if len(tags_list) > 3 else ''}")
             print(f"Description: {description[:100]}{'...' if len(description) > 100 else ''}")
@@ -715,7 +1177,6 @@ class Scraper:
         print(f"📝 Articles with descriptions: {articles_with_descriptions}")
         print(f"📅 Articles with dates: {articles_with_dates}")
         
-        conn.close()
 
 def main():
     """Run the scraper with different modes"""
@@ -747,6 +1208,11 @@ def main():
             # Just check what needs updating
             articles_to_update = scraper.check_for_updates()
             if articles_to_update:
+                # Changed entries we hold an ETag/Last-Modified for are fetched conditionally
+                revalidated = sum(1 for url_data in articles_to_update
+                                  if url_data.get('etag') or url_data.get('http_last_modified'))
+                if revalidated:
+                    print(f"\n🔁 {revalidated} of these will be revalidated first (unchanged pages answer 304 and are skipped)")
                 print(f"\nRun with --update to scrape these {len(articles_to_update)} articles")
             else:
                 print("\n✅ No updates needed")
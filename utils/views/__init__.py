@@ -1,4 +0,0 @@
-# Views package for the Digital Librarian bot
-from .library_view import LibraryView, CategorySelect, AuthorSelect, SearchModal
-
-__all__ = ['LibraryView', 'CategorySelect', 'AuthorSelect', 'SearchModal'] 
\ No newline at end of file